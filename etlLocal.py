@@ -18,41 +18,56 @@
 
 from etlModule import EmailUtility
 from etlModule import ETLProcess
+from etlModule import configure_queue_logging
 
-from datetime import datetime
+import asyncio
+import time
 import logging
 import os
 
-logging.basicConfig(level=logging.INFO)
+configure_queue_logging(logging.INFO)
 
-def main():
+async def main():
 
-    start_time = datetime.now()
+    start_time = time.perf_counter()
     # Initialize the ETLProcess with a configuration file. Replace 'e:\ETLsolutions\config_local.ini' with your local path to the config file.
     etl = ETLProcess('e:\ETLsolutions\config_local.ini')  
 
+    cfg = etl.cfg
+
     try:          
-        downloadPath = etl.config['ETL']['download_path']   
-        etl.empty_folder_of_zip_csv(downloadPath)
+        # Read all required settings once up front
+        downloadPath = cfg.download_path   
+        filename = cfg.file_name   
+        archivePath = cfg.archive_path  
+        tableName = cfg.table_name          
+        folderPath = cfg.folder_path   
+
+        # Skip the run entirely when the source has not changed since the last successful load
+        if etl.skip_unchanged_input and etl.input_unchanged(folderPath):
+            logging.info("Source unchanged since last run; nothing to do.")
+            return
 
-        filename = etl.config['ETL']['file_name']   
-        archivePath = etl.config['ETL']['archive_path']  
-        tableName = etl.config['MSSQL']['table_name']          
+        # Run the blocking disk and database steps on worker threads so the event loop stays free
+        await asyncio.to_thread(etl.empty_folder_of_zip_csv, downloadPath)
 
-        folderPath = etl.config['LOCAL_SOURCE']['folder_path']   
         print(folderPath, tableName)  
-        etl.process_file(folderPath,archivePath,tableName)
+        fingerprint = await asyncio.to_thread(etl.process_file, folderPath, archivePath, tableName)
          
-        end_time = datetime.now()
-        execution_time = (end_time - start_time).total_seconds()
-        etl.email_util.send_email("ETL Process Successful", f"The ETL process completed successfully in {execution_time} seconds.")
+        execution_time = time.perf_counter() - start_time
+
+        # Send the notification while recording the source state, since neither depends on the other
+        tasks = [asyncio.to_thread(etl.email_util.send_email, "ETL Process Successful", f"The ETL process completed successfully in {execution_time} seconds.")]
+        if etl.skip_unchanged_input and fingerprint:
+            # Record the files that were loaded so an unchanged source is skipped next run, but only when every file loaded
+            tasks.append(asyncio.to_thread(etl.save_input_state, folderPath, fingerprint))
+        await asyncio.gather(*tasks)
         logging.info("ETL process completed successfully.")
 
     except Exception as e:
-        logging.error(f"ETL process failed: {str(e)}")
-        etl.email_util.send_email("ETL Process Failed", f"ETL process failed with error: {str(e)}")
+        logging.error("ETL process failed: %s", e)
+        await asyncio.to_thread(etl.email_util.send_email, "ETL Process Failed", f"ETL process failed with error: {str(e)}")
 
 
 if __name__ == "__main__":
-    main()
-
+    asyncio.run(main())
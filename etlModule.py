@@ -38,30 +38,531 @@ Description:
            - Provides utilities for file extraction, handling compressed files, and archiving processed data.
            - Configurable through INI files for dynamic ETL process management.
 
+    3. ETLConfig:
+       ----------
+       - Purpose: To hold every setting parsed from the INI configuration as a frozen, slotted dataclass, 
+         built once per configuration file and shared by all ETLProcess instances.
+
 
 """
 
 import configparser
+import functools
+import itertools
+import operator
+import hashlib
+import threading
+import time
+import queue
+import re
 import logging
+import logging.handlers
+import atexit
+import errno
 import requests
+from urllib.parse import quote_plus
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import os
-import glob
 import zipfile
 import subprocess
 import pyodbc
 import shutil
+import tempfile
 import csv
-from datetime import datetime
+from dataclasses import dataclass
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed, wait
 from email.mime.multipart import MIMEMultipart
 from email.mime.text import MIMEText
 import smtplib
 import pandas as pd
 import boto3
+from boto3.s3.transfer import TransferConfig
+from botocore.config import Config
 import paramiko
 import json
 from sqlalchemy import create_engine
 import numpy as np
 
+# mssql-python (>= 1.4) provides native TDS bulk copy; fall back to pyodbc when it is not installed
+try:
+    import mssql_python
+except ImportError:
+    mssql_python = None
+
+# orjson parses and serializes JSON in C; fall back to the standard library json module when it is not installed
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# ijson parses JSON incrementally; fall back to loading the whole document when it is not installed
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+# pyarrow provides a multithreaded CSV reader and Arrow-backed DataFrame columns; the arrow import method is unavailable
+# and pandas_import keeps NumPy object columns when it is not installed
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.csv as pacsv
+except ImportError:
+    pa = pc = pacsv = None
+
+"""
+    Parses JSON from bytes or text, using orjson when it is available.
+
+    :param data: A bytes or string object containing the JSON document.
+    :return: The Python object represented by the document.
+
+"""
+def _json_loads(data):
+    return orjson.loads(data) if orjson else json.loads(data)
+
+
+"""
+    Serializes a Python object to a JSON string, using orjson when it is available.
+
+    :param obj: The Python object to serialize.
+    :return: A string containing the JSON document.
+
+"""
+def _json_dumps(obj):
+    return orjson.dumps(obj).decode('utf-8') if orjson else json.dumps(obj)
+
+
+# Transfer settings shared by S3 downloads: objects over 8 MiB are fetched as concurrent multipart ranges
+_S3_TRANSFER_CONFIG = TransferConfig(multipart_threshold=8 * 1024 * 1024, max_concurrency=10, use_threads=True)
+
+# Background executor for slow cleanup, such as deleting directory trees, that the ETL run does not wait on
+_BACKGROUND_EXECUTOR = ThreadPoolExecutor(max_workers=2)
+
+# Cache of decrypted SSM parameter values, keyed by name as (value, expires_at)
+_SSM_CACHE = {}
+_SSM_LOCK = threading.Lock()
+
+"""
+    Returns the shared SSM client, creating it on first use.
+
+    boto3 clients are thread-safe, and creating one loads the service model, so every caller in the process 
+    shares a single client. Its connections set TCP keepalive, in addition to the TCP_NODELAY botocore always 
+    sets, so the pooled connections survive the gaps between parameter lookups.
+
+    :return: A boto3 SSM client for the us-west-2 region.
+
+"""
+@functools.lru_cache(maxsize=None)
+def _ssm():
+    return boto3.client('ssm', region_name='us-west-2', config=Config(tcp_keepalive=True))
+
+
+"""
+    Returns the shared S3 client, creating it on first use.
+
+    :return: A boto3 S3 client.
+
+"""
+@functools.lru_cache(maxsize=None)
+def _s3():
+    return boto3.client('s3')
+
+
+"""
+    Retrieves a decrypted parameter from AWS SSM Parameter Store, caching it for reuse.
+
+    The shared SSM client from `_ssm` is used for the lookups. Values are cached in memory for `max_age` seconds, 
+    so repeated EmailUtility and ETLProcess instances in the same process do not repeat the SSM and KMS round trips. 
+    Access to the cache is guarded by a lock.
+
+    :param name: A string containing the name of the parameter.
+    :param max_age: The number of seconds a cached value stays valid. Defaults to 300.
+    :return: A string containing the decrypted parameter value.
+
+"""
+def _get_ssm_parameter(name, max_age=300):
+
+    with _SSM_LOCK:
+        # Return the cached value if it has not expired
+        now = time.monotonic()
+        cached = _SSM_CACHE.get(name)
+        if cached and cached[1] > now:
+            return cached[0]
+
+        # Retrieve the decrypted value and cache it with its expiry time
+        value = _ssm().get_parameter(Name=name, WithDecryption=True)['Parameter']['Value']
+        _SSM_CACHE[name] = (value, now + max_age)
+        return value
+
+
+"""
+    Configures the root logger to hand records to a background thread.
+
+    Records are put on an in-memory queue by a QueueHandler, and a QueueListener thread formats them and writes them 
+    to stderr, so the calling code never blocks on a slow console or journal. The listener is stopped at exit, which 
+    flushes any records still on the queue.
+
+    :param level: The logging level to set on the root logger. Defaults to logging.INFO.
+    :return: The logging.handlers.QueueListener that writes the records.
+
+"""
+def configure_queue_logging(level=logging.INFO):
+
+    # Create the stream handler that the listener thread writes to, using the same format as logging.basicConfig
+    stream_handler = logging.StreamHandler()
+    stream_handler.setFormatter(logging.Formatter(logging.BASIC_FORMAT))
+
+    # Route root logger records through an unbounded queue to the listener thread
+    log_queue = queue.Queue(-1)
+    root = logging.getLogger()
+    root.setLevel(level)
+    root.addHandler(logging.handlers.QueueHandler(log_queue))
+
+    # Start the listener and stop it at exit so queued records are flushed
+    listener = logging.handlers.QueueListener(log_queue, stream_handler, respect_handler_level=True)
+    listener.start()
+    atexit.register(listener.stop)
+    return listener
+
+
+"""
+    Reads and parses an INI configuration file, caching the parsed result.
+
+    The cache is keyed on the file path and its modification time, so repeated ETLProcess instances 
+    in the same process reuse one parsed configuration, while an edited file is parsed again.
+
+    :param config_file: A string containing the path to the configuration file.
+    :param mtime: The modification time of the configuration file, or None if it does not exist.
+    :return: A configparser.ConfigParser object containing the parsed configuration.
+
+"""
+@functools.lru_cache(maxsize=None)
+def _read_config(config_file, mtime):
+    config = configparser.ConfigParser()
+    config.read(config_file)
+    return config
+
+
+"""
+    Reads the column types from the optional SCHEMA section of an INI configuration file, caching the result.
+
+    The section is parsed by its own ConfigParser that preserves the case of option names, so its entries match 
+    the column names in the data files, while every other section keeps the usual case-insensitive option names. 
+    Like `_read_config`, the cache is keyed on the file path and its modification time.
+
+    :param config_file: A string containing the path to the configuration file.
+    :param mtime: The modification time of the configuration file, or None if it does not exist.
+    :return: A dictionary mapping column names to their types, empty if there is no SCHEMA section.
+
+"""
+@functools.lru_cache(maxsize=None)
+def _read_schema(config_file, mtime):
+    config = configparser.ConfigParser()
+    # Preserve the case of option names so SCHEMA entries match the column names in the data files
+    config.optionxform = str
+    config.read(config_file)
+    return dict(config['SCHEMA']) if config.has_section('SCHEMA') else {}
+
+
+# The backslash escapes understood in terminator settings, and the characters they stand for
+_ESCAPES = {'\\t': '\t', '\\n': '\n', '\\r': '\r', '\\\\': '\\'}
+_ESCAPE_RE = re.compile(r'\\[tnr\\]')
+_ESCAPE_TABLE = str.maketrans({char: escape for escape, char in _ESCAPES.items()})
+
+"""
+    Translates the backslash escapes \\t, \\n, \\r, and \\\\ in a configuration value into the characters they stand for.
+
+    Any other backslash, and any non-ASCII character, is left unchanged, so a value such as a Windows path or an 
+    accented delimiter reads as written.
+
+    :param value: A string containing the value as written in the configuration file.
+    :return: The string with its escapes translated.
+
+"""
+def _unescape(value):
+    return _ESCAPE_RE.sub(lambda match: _ESCAPES[match.group()], value)
+
+
+"""
+    Renders tabs, newlines, carriage returns, and backslashes in a value as the backslash escapes that bcp and 
+    BULK INSERT expect for terminators. All other characters are left unchanged.
+
+    :param value: A string containing the value with real control characters.
+    :return: The string with those characters escaped, such as a tab as \\t.
+
+"""
+def _escape(value):
+    return value.translate(_ESCAPE_TABLE)
+
+
+"""
+    Extracts all members of a ZIP file into a directory.
+
+    This function is defined at module level so it can be pickled and run in a worker process.
+
+    :param zip_path: A string containing the path to the ZIP file.
+    :param extract_path: A string containing the path to the directory where the members should be extracted.
+    :return: A tuple containing the ZIP file path and the extraction path.
+
+"""
+def _extract_zip(zip_path, extract_path):
+    with zipfile.ZipFile(zip_path, 'r') as zip_ref:
+        zip_ref.extractall(extract_path)
+    return zip_path, extract_path
+
+
+"""
+    Streams a single member of an open ZIP file to disk.
+
+    The member is copied with a 1 MiB buffer rather than read into memory. Absolute paths and ".." components are 
+    rejected the same way `ZipFile.extractall` does, so a member cannot be written outside the destination directory.
+
+    :param zip_ref: An open zipfile.ZipFile object containing the member.
+    :param member: The zipfile.ZipInfo object of the member to extract.
+    :param dest_dir: A string containing the path to the directory where the member should be extracted.
+    :return: A string containing the path of the extracted file or directory.
+
+"""
+def _extract_member(zip_ref, member, dest_dir):
+
+    # Build the target path, dropping drive letters, absolute roots, and parent directory components
+    parts = [part for part in os.path.splitdrive(member.filename)[1].replace('\\', '/').split('/') if part not in ('', '.', '..')]
+    target = os.path.join(dest_dir, *parts)
+
+    # Create directories directly, and the parent directory of files before copying them
+    if member.is_dir():
+        os.makedirs(target, exist_ok=True)
+        return target
+    os.makedirs(os.path.dirname(target) or '.', exist_ok=True)
+    with zip_ref.open(member) as source, open(target, 'wb') as destination:
+        shutil.copyfileobj(source, destination, length=1 << 20)
+    return target
+
+
+# Accounting-style negative number, such as "(1234.50)"; compiled once and shared by all values
+_PAREN_RE = re.compile(r'^\(([0-9]*\.?[0-9]+(?:[eE][-+]?[0-9]+)?)\)$')
+
+# Matches _PAREN_RE against every element of an object array in one pass, giving None for non-strings and non-matches
+_match_paren = np.frompyfunc(lambda value: _PAREN_RE.match(value) if isinstance(value, str) else None, 1, 1)
+
+
+"""
+    Cleans a pyarrow string array with pyarrow compute kernels, matching the cleaning of object columns.
+
+    Optional double quotes are removed, "-" and "<NA>" become missing, and numbers enclosed in parentheses are 
+    converted to negative numbers. The kernels run over the contiguous Arrow buffers, and Python objects are only 
+    created for the final column handed to the loader.
+
+    :param values: A pyarrow Array of strings.
+    :return: A NumPy object array containing strings, floats, and None.
+
+"""
+def _clean_arrow_array(values):
+
+    # Remove optional double quotes, then turn "-" and "<NA>" into nulls
+    values = pc.utf8_trim(values, '"')
+    values = pc.if_else(pc.is_in(values, value_set=pa.array(['-', '<NA>'], type=values.type)), pa.scalar(None, values.type), values)
+
+    # Find the numbers enclosed in parentheses and convert them to negative floats
+    is_negative = pc.fill_null(pc.match_substring_regex(values, _PAREN_RE.pattern), False)
+    numbers = pc.if_else(is_negative, pc.replace_substring_regex(values, _PAREN_RE.pattern, r'\1'), pa.scalar(None, values.type))
+    negatives = pc.negate(pc.cast(numbers, pa.float64()))
+
+    # Combine the negative numbers and the remaining text into one object column
+    text = pd.arrays.ArrowExtensionArray(values).to_numpy(dtype=object, na_value=None)
+    numbers = pd.arrays.ArrowExtensionArray(negatives).to_numpy(dtype=object, na_value=None)
+    mask = pd.arrays.ArrowExtensionArray(is_negative).to_numpy(dtype=bool)
+    return np.where(mask, numbers, text)
+
+
+"""
+    Cleans an Arrow-backed string column with `_clean_arrow_array`.
+
+    :param series: A pandas Series with a string ArrowDtype.
+    :return: A pandas Series of objects containing strings, floats, and None.
+
+"""
+def _clean_arrow_strings(series):
+    return pd.Series(_clean_arrow_array(pa.array(series)), index=series.index, dtype=object)
+
+
+"""
+    Cleans a single value read by csv.reader, for the `fast_csv_reader` path of pandas_import.
+
+    Optional double quotes are removed, numbers enclosed in parentheses are converted to negative numbers, and empty 
+    values, "-", and "<NA>" are converted to None. Unlike pandas, other missing-value markers such as "NA" and "NULL" 
+    are kept as text.
+
+    :param value: A string containing the raw value.
+    :return: The cleaned value as a string, a float, or None.
+
+"""
+def _clean_csv_value(value):
+    value = value.strip('"')
+    if value in ('', '-', '<NA>'):
+        return None
+    match = _PAREN_RE.match(value)
+    return -float(match.group(1)) if match else value
+
+
+"""
+    Yields the paths of the files under a directory whose names end with a suffix.
+
+    The directory tree is walked with `os.scandir`, whose entries carry the file type from the directory listing, 
+    so no separate stat call is needed to tell files from directories. Symbolic links to directories are not followed.
+
+    :param root: A string containing the path to the directory to search.
+    :param suffix: A string, or a tuple of strings, that the file names must end with.
+    :return: A generator of strings containing the paths of the matching files.
+
+"""
+def _iter_matches(root, suffix):
+    with os.scandir(root) as it:
+        for entry in it:
+            if entry.is_dir(follow_symlinks=False):
+                yield from _iter_matches(entry.path, suffix)
+            elif entry.name.endswith(suffix) and entry.is_file():
+                yield entry.path
+
+
+# ETLConfig class
+@dataclass(frozen=True, slots=True)
+class ETLConfig:
+
+    """
+        Holds the settings read from the INI configuration.
+
+        The values are parsed once per configuration file by `_load_etl_config`, so a missing key fails at startup 
+        rather than part way through a run, and later reads are plain attribute lookups instead of section lookups 
+        and string-to-boolean conversions.
+
+    """
+
+    # Paths and names read by the ETL drivers
+    download_path: str
+    file_name: str
+    archive_path: str
+    table_name: str
+    folder_path: str
+
+    # Database settings
+    db_type: str
+    db_server: str
+    db_name: str
+    db_user: str
+    drop_table_if_exists: bool
+    odbc_driver: str
+    bulkcopy_batch_size: int
+    bulkcopy_table_lock: bool
+    audit_table: str
+    disable_indexes_on_load: bool
+    batch_size: int
+
+    # Column types from the optional SCHEMA section
+    schema: dict
+    date_columns: tuple
+    date_format: str | None
+
+    # File settings
+    field_delimiter: str
+    file_prefix: str
+    file_suffix: str
+    file_extensions: str
+    file_type: str
+    file_has_header: bool
+    skip_unchanged_input: bool
+    use_bulk_copy: bool
+    fast_csv_reader: bool
+    parallel_files: int
+
+    # BCP settings
+    bcp_end_of_row: str
+    bcp_row_start: str
+    bcp_batch_commit_size: str
+
+    # Import method switches
+    bcp_import: bool
+    bulkInsert_import: bool
+    bulkcopy_import: bool
+    arrow_import: bool
+    pandas_import: bool
+
+
+"""
+    Parses the ETL settings from an INI configuration file into an ETLConfig, caching the result.
+
+    Like `_read_config`, the cache is keyed on the file path and its modification time, so ETLProcess instances 
+    created for the same unchanged file share one ETLConfig and skip the parsing entirely.
+
+    :param config_file: A string containing the path to the configuration file.
+    :param mtime: The modification time of the configuration file, or None if it does not exist.
+    :return: An ETLConfig object containing the parsed settings.
+
+"""
+@functools.lru_cache(maxsize=None)
+def _load_etl_config(config_file, mtime):
+    config = _read_config(config_file, mtime)
+    etl = config['ETL']
+    mssql = config['MSSQL']
+    import_method = config['IMPORT_METHOD']
+
+    # Read explicit column types from the optional SCHEMA section, separating date columns to be parsed
+    schema = _read_schema(config_file, mtime)
+    date_columns = tuple(column for column, dtype in schema.items() if dtype.startswith('datetime'))
+
+    return ETLConfig(
+        download_path=etl['download_path'],
+        file_name=etl['file_name'],
+        archive_path=etl['archive_path'],
+        table_name=mssql['table_name'],
+        folder_path=config.get('LOCAL_SOURCE', 'folder_path', fallback=''),
+        db_type=etl['database_type'],
+        db_server=mssql['server'],
+        db_name=mssql['database'],
+        db_user=mssql['user'],
+        drop_table_if_exists=mssql.getboolean('drop_table_if_exists'),
+        # ODBC driver used for pyodbc connections; newer drivers support fast_executemany reliably
+        odbc_driver=mssql.get('odbc_driver', fallback='SQL Server'),
+        # TDS bulk copy settings, defaulting to 50,000-row batches under a table lock
+        bulkcopy_batch_size=mssql.getint('bulkcopy_batch_size', fallback=50000),
+        bulkcopy_table_lock=mssql.getboolean('bulkcopy_table_lock', fallback=True),
+        # Name of the table recording loaded files by content hash; blank disables load auditing
+        audit_table=mssql.get('audit_table', fallback='').strip(),
+        # When enabled, nonclustered indexes are disabled during a load and rebuilt afterwards
+        disable_indexes_on_load=mssql.getboolean('disable_indexes_on_load', fallback=False),
+        # Number of rows sent to the database per executemany call, defaulting to 10,000
+        batch_size=mssql.getint('batch_size', fallback=10000),
+        schema={column: dtype for column, dtype in schema.items() if column not in date_columns},
+        date_columns=date_columns,
+        # Explicit format for the date columns, which lets pandas parse them without per-value format inference
+        date_format=etl.get('date_format', fallback='') or None,
+        # Translate escapes such as \t and \n in the field delimiter and end of row character into the characters themselves
+        field_delimiter=_unescape(etl['field_delimiter']),
+        file_prefix=etl['file_prefix'],
+        file_suffix=etl['file_suffix'],
+        file_extensions=etl['file_extensions'],
+        file_type=etl['file_type'],
+        file_has_header=etl.getboolean('file_has_header'),
+        # When enabled, runs whose input has not changed since the last successful load are skipped
+        skip_unchanged_input=etl.getboolean('skip_unchanged_input', fallback=False),
+        # Alias of bcp_import: when enabled, files are loaded with BCP whatever the IMPORT_METHOD section selects
+        use_bulk_copy=etl.getboolean('use_bulk_copy', fallback=False),
+        # When enabled, pandas_import reads files without a SCHEMA section with csv.reader instead of DataFrames
+        fast_csv_reader=etl.getboolean('fast_csv_reader', fallback=False),
+        # Number of files loaded concurrently by process_file
+        parallel_files=etl.getint('parallel_files', fallback=4),
+        bcp_end_of_row=_unescape(etl['bcp_end_of_row']),
+        bcp_row_start=etl['bcp_row_start'],
+        bcp_batch_commit_size=etl['bcp_batch_commit_size'],
+        bcp_import=import_method.getboolean('bcp_import'),
+        bulkInsert_import=import_method.getboolean('bulkInsert_import'),
+        bulkcopy_import=import_method.getboolean('bulkcopy_import', fallback=False),
+        arrow_import=import_method.getboolean('arrow_import', fallback=False),
+        pandas_import=import_method.getboolean('pandas_import'),
+    )
+
+
 # EmailUtility class
 class EmailUtility:
 
@@ -82,11 +583,8 @@ class EmailUtility:
         """
 
 
-        # Initialize the AWS SSM client to securely retrieve the SMTP password
-        ssm = boto3.client('ssm', region_name='us-west-2')  
-
-        # Retrieves and stores the SMTP password from AWS SSM using the key 'smtp_password
-        self.smtp_password = ssm.get_parameter(Name='smtp_password', WithDecryption=True)['Parameter']['Value']
+        # Retrieves and stores the SMTP password from AWS SSM using the key 'smtp_password', reusing a cached value if available
+        self.smtp_password = _get_ssm_parameter('smtp_password')
 
         # Configures the SMTP server, port, user, and recipient using the values from the 'email_config' dictionary
         self.server = email_config['smtp_server']
@@ -119,6 +617,23 @@ class EmailUtility:
         server.quit()
         logging.info("Email sent successfully")
 
+
+    def send_email_async(self, subject, body):
+
+        # Log a failure to send from inside the thread, since an exception raised there never reaches the caller
+        def send():
+            try:
+                self.send_email(subject, body)
+            except Exception as e:
+                logging.error("Failed to send email '%s': %s", subject, e)
+
+        # Send the email on a separate non-daemon thread so the caller is not blocked while SMTP negotiates
+        thread = threading.Thread(target=send, daemon=False)
+        thread.start()
+
+        # Return the thread so the caller can join it with a timeout once its own work is done
+        return thread
+
 # ETLProcess class
 class ETLProcess:
 
@@ -140,107 +655,276 @@ class ETLProcess:
 
     def __init__(self, config_file):
 
-        # Initialize the AWS SSM client
-        ssm = boto3.client('ssm', region_name='us-west-2')  
+        # Retrieve the SQL password from AWS SSM, reusing a cached value if available
+        self.pwd = _get_ssm_parameter('sql_password')
 
-        # Retrieve the SQL password from AWS SSM
-        self.pwd = ssm.get_parameter(Name='sql_password', WithDecryption=True)['Parameter']['Value']
+        # Read the provided configuration file, reusing the parsed result if the file has not changed
+        mtime = os.path.getmtime(config_file) if os.path.exists(config_file) else None
+        self.config = _read_config(config_file, mtime)
 
-        # Initialize the configuration parser and read the provided configuration file
-        self.config = configparser.ConfigParser()
-        self.config.read(config_file)
+        # Get the parsed settings as a frozen config object, shared by every instance created for the same file
+        self.cfg = cfg = _load_etl_config(config_file, mtime)
 
         # Set up logging
         self.setup_logging()
 
+        # Create a pooled HTTP session with retries, reused by every URL download so connections are kept alive
+        self._http = requests.Session()
+        adapter = HTTPAdapter(pool_connections=10, pool_maxsize=10, max_retries=Retry(total=3, backoff_factor=0.5))
+        self._http.mount('http://', adapter)
+        self._http.mount('https://', adapter)
+
         # Initialize the email utility and database configuration from the provided configuration
         self.email_util = EmailUtility(self.config['EMAIL'])
-        self.db_type = self.config['ETL']['database_type']      
-        self.dbServer = self.config['MSSQL']['server']
-        self.dbName = self.config['MSSQL']['database']            
-        self.uid = self.config['MSSQL']['user']
-        self.tableName = self.config['MSSQL']['table_name']
-        self.drop_table_if_exists = self.config['MSSQL'].getboolean('drop_table_if_exists')
-
-        # Get the field delimiter from the configuration
-        delimiter = self.config['ETL']['field_delimiter']     
-
-        # If the delimiter is a tab, enclose it in quotes
-        if delimiter == r'\t':
-            self.field_delimiter = '\t'                  # this becomes a string
-        else:
-            self.field_delimiter = delimiter
-
-        # Extract file-related configuration details from the ETL configuration
-        self.file_name = self.config['ETL']['file_name']
-        self.file_prefix = self.config['ETL']['file_prefix']
-        self.file_suffix = self.config['ETL']['file_suffix']
-        self.file_extensions = self.config['ETL']['file_extensions']
-        self.file_type = self.config['ETL']['file_type']
-        self.file_has_header = self.config['ETL'].getboolean('file_has_header')
-        self.archive_path = self.config['ETL']['archive_path']
-
-        # Set the end of row character for BCP, handling the special case where the end of row character is a newline
-        bcp_end_of_row = self.config['ETL']['bcp_end_of_row']
-        if bcp_end_of_row == r'\n':
-            self.bcp_end_of_row = '"\\n"'   
-        else:
-            self.bcp_end_of_row = bcp_end_of_row
+        self.db_type = cfg.db_type
+        self.dbServer = cfg.db_server
+        self.dbName = cfg.db_name
+        self.uid = cfg.db_user
+        self.tableName = cfg.table_name
+        self.drop_table_if_exists = cfg.drop_table_if_exists
+
+        # Cache of view column names, keyed by (server, database, table), so each file does not re-query the catalog
+        self._col_cache: dict[tuple, list] = {}
+
+        # Connections reused across files by the JSON handler and table creation, one per thread, and every one opened
+        self._local = threading.local()
+        self._conns = []
+        self._conns_lock = threading.Lock()
+
+        self.odbc_driver = cfg.odbc_driver
 
-        # Extract BCP-related configuration details from the ETL configuration
-        self.bcp_row_start = self.config['ETL']['bcp_row_start']
-        self.bcp_batch_commit_size = self.config['ETL']['bcp_batch_commit_size']
-        self.bcp_end_of_row = self.config['ETL']['bcp_end_of_row']
+        # Create a pooled engine once, so connections are reused instead of re-authenticating for every import
+        self.engine = None
+        if self.db_type == 'mssql':
+            # Construct a connection string for a SQL Server database using provided server and database names
+            conn_str = f'DRIVER={{{self.odbc_driver}}};SERVER={self.dbServer};DATABASE={self.dbName};'
 
-        # Extract import method preferences from the ETL configuration
-        self.bcp_import_bool = self.config['IMPORT_METHOD'].getboolean('bcp_import')
-        self.bulkInsert_import_bool = self.config['IMPORT_METHOD'].getboolean('bulkInsert_import')
-        self.pandas_import_bool = self.config['IMPORT_METHOD'].getboolean('pandas_import')
+            # If user ID and password are provided, add them to the connection string
+            if self.uid and self.pwd:
+                conn_str += f'UID={self.uid};PWD={self.pwd}'
+            else:
+                # If user ID and password are not provided, use a trusted connection
+                conn_str += 'Trusted_Connection=yes;'
+
+            self.engine = create_engine(f"mssql+pyodbc:///?odbc_connect={quote_plus(conn_str)}",
+                                        fast_executemany=True, pool_size=5, pool_pre_ping=True)
+
+        # Copy the database and load settings from the config object
+        self.bulkcopy_batch_size = cfg.bulkcopy_batch_size
+        self.bulkcopy_table_lock = cfg.bulkcopy_table_lock
+        self.audit_table = cfg.audit_table
+        self.audit_table_ready = False
+        self.disable_indexes_on_load = cfg.disable_indexes_on_load
+        self.batch_size = cfg.batch_size
+
+        # Copy the column types, as mutable containers since pandas expects a dict and a list
+        self.schema = dict(cfg.schema)
+        self.date_columns = list(cfg.date_columns)
+        self.date_format = cfg.date_format
+
+        # Copy the file-related settings from the config object
+        self.field_delimiter = cfg.field_delimiter
+        self.file_name = cfg.file_name
+        self.file_prefix = cfg.file_prefix
+        self.file_suffix = cfg.file_suffix
+        self.file_extensions = cfg.file_extensions
+        self.file_type = cfg.file_type
+        self.file_has_header = cfg.file_has_header
+        self.archive_path = cfg.archive_path
+        self.skip_unchanged_input = cfg.skip_unchanged_input
+        self.use_bulk_copy = cfg.use_bulk_copy
+        self.fast_csv_reader = cfg.fast_csv_reader
+        self.parallel_files = cfg.parallel_files
+
+        # Map the file types to their respective handler functions once, rather than for every file processed
+        self.file_type_handlers = {
+            'txt': self.handle_csv,
+            'csv': self.handle_csv,
+            'json': self.handle_json,
+        }
+
+        # Copy the BCP-related settings from the config object
+        self.bcp_end_of_row = cfg.bcp_end_of_row
+        self.bcp_row_start = cfg.bcp_row_start
+        self.bcp_batch_commit_size = cfg.bcp_batch_commit_size
+
+        # Copy the import method preferences from the config object
+        self.bcp_import_bool = cfg.bcp_import
+        self.bulkInsert_import_bool = cfg.bulkInsert_import
+        self.bulkcopy_import_bool = cfg.bulkcopy_import
+        self.arrow_import_bool = cfg.arrow_import
+        self.pandas_import_bool = cfg.pandas_import
    
 
     """
         Empties a folder of all ZIP and CSV files.
 
-        This method searches for all ZIP and CSV files in the specified folder and removes them.
-        It also removes any other files and directories in the folder.
+        This method removes every file, symbolic link, and directory in the specified folder, which includes 
+        all ZIP and CSV files. The removals are independent and I/O-bound, so they are run concurrently on a 
+        thread pool and the method waits for all of them to finish before returning.
+
+        Directories are first renamed into a temporary folder next to the specified folder, which is a single 
+        rename each, and the temporary folder is then deleted on a background thread, so the ETL run does not wait 
+        on large directory trees. If a directory cannot be renamed, it is deleted in place instead. Temporary folders 
+        left behind by an earlier run that was stopped before its background deletion finished are deleted the same way.
 
         :param folder_path: A string containing the path to the folder to be emptied.
 
     """
     def empty_folder_of_zip_csv(self, folder_path):
-        
-        # Define the file patterns for ZIP and CSV files
-        file_patterns = ['*.zip', '*.csv']
 
-        # Iterate over the defined file patterns
-        for pattern in file_patterns:
-            # Construct the full pattern by joining the folder path and the file pattern
-            full_pattern = os.path.join(folder_path, pattern)
+        # List every file and directory in the specified folder in a single directory read
+        with os.scandir(folder_path) as it:
+            entries = list(it)
 
-            # Iterate over all files matching the full pattern
-            for filename in glob.glob(full_pattern):
-                try:
-                    # Attempt to remove the file and print a message if successful
-                    os.remove(filename)
-                    print(f"Removed {filename}")
-                except OSError as e:
-                    # Print an error message if the file could not be removed
-                    print(f"Error: {e.strerror}")
-
-        # Iterate over all files and directories in the specified folder
-        for filename in os.listdir(folder_path):
-            # Construct the full file path by joining the folder path and the filename
-            file_path = os.path.join(folder_path, filename)
+        # Delete in the background any temporary folders that an earlier run left beside the specified folder
+        parent_path = os.path.dirname(os.path.abspath(folder_path))
+        try:
+            with os.scandir(parent_path) as it:
+                stale = [entry.path for entry in it if entry.name.startswith('.etl-trash-') and entry.is_dir(follow_symlinks=False)]
+        except OSError:
+            stale = []
+        for stale_path in stale:
+            _BACKGROUND_EXECUTOR.submit(shutil.rmtree, stale_path, ignore_errors=True)
+
+        # If there are directories, create a temporary folder beside the specified folder to move them into
+        trash_path = None
+        if any(entry.is_dir(follow_symlinks=False) for entry in entries):
             try:
-                # If the file path is a file or a symbolic link, attempt to unlink (remove) it
-                if os.path.isfile(file_path) or os.path.islink(file_path):
-                    os.unlink(file_path)
-                # If the file path is a directory, attempt to remove it and all its contents
-                elif os.path.isdir(file_path):
-                    shutil.rmtree(file_path)
-            except Exception as e:
-                # Print an error message if the file or directory could not be removed
-                print(f'Failed to delete {file_path}. Reason: {e}')                    
+                trash_path = tempfile.mkdtemp(prefix='.etl-trash-', dir=parent_path)
+            except OSError:
+                trash_path = None
+
+        # Define a function that removes a single entry of the folder, using the type cached by os.scandir
+        def remove(entry):
+            try:
+                # If the entry is a directory, move it out of the folder to be deleted later, or delete it now if that fails
+                if entry.is_dir(follow_symlinks=False):
+                    moved = False
+                    if trash_path:
+                        try:
+                            os.replace(entry.path, os.path.join(trash_path, entry.name))
+                            moved = True
+                        except OSError:
+                            pass
+                    if not moved:
+                        shutil.rmtree(entry.path)
+                # Otherwise it is a file or a symbolic link, so attempt to unlink (remove) it
+                else:
+                    os.unlink(entry.path)
+                    print(f"Removed {entry.path}")
+            except OSError as e:
+                # Log a warning if the file or directory could not be removed
+                logging.warning("Failed to delete %s. Reason: %s", entry.path, e)
+
+        # Submit each removal to a thread pool and wait for all of them to complete
+        with ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 1) * 4)) as executor:
+            wait([executor.submit(remove, entry) for entry in entries])
+
+        # Delete the moved directories in the background; pending deletions are finished before the interpreter exits
+        if trash_path:
+            _BACKGROUND_EXECUTOR.submit(shutil.rmtree, trash_path, ignore_errors=True)
+
+
+    """
+        Returns the input files that process_file would load for a path.
+
+        These are the files in the path's directory and its subdirectories whose names end with the configured 
+        suffix and file type. A path to a folder is searched itself; for any other path its parent folder is searched.
+
+        :param file_path: A string containing the path passed to process_file.
+        :return: A list of strings containing the paths of the matching files.
+
+    """
+    def find_input_files(self, file_path):
+        suffix = (self.file_suffix + '.' + self.file_type,)
+        return list(_iter_matches(self.input_directory(file_path), suffix))
+
+
+    """
+        Returns the folder that holds the input files for a path: the path itself if it is a folder, otherwise its parent.
+
+        :param file_path: A string containing the path passed to process_file.
+        :return: A string containing the path of the folder.
+
+    """
+    def input_directory(self, file_path):
+        return file_path if os.path.isdir(file_path) else os.path.dirname(file_path)
+
+
+    """
+        Computes a cheap fingerprint of the input files under a file or folder path.
+
+        The fingerprint lists every file that process_file would load for the path, found by `find_input_files`, 
+        with its path relative to the directory, its modification time in nanoseconds and its size. Files added, 
+        removed or changed anywhere in the subfolders therefore change the fingerprint, without any file being read.
+
+        :param path: A string containing the path to the input file or folder.
+        :param file_paths: An optional list of the files to fingerprint, instead of the files found under the path.
+        :return: A dictionary containing the fingerprint of the input files.
+
+    """
+    def input_fingerprint(self, path, file_paths=None):
+
+        # Find the matching files, unless the caller already has the list it is about to load
+        if file_paths is None:
+            file_paths = self.find_input_files(path)
+
+        # Stat each file, in a stable order so equal inputs give equal fingerprints
+        directory_path = self.input_directory(path)
+        files = []
+        for file_path in sorted(file_paths):
+            stat = os.stat(file_path)
+            files.append([os.path.relpath(file_path, directory_path), stat.st_mtime_ns, stat.st_size])
+
+        return {'files': files}
+
+
+    """
+        Checks whether the input files under a file or folder path are unchanged since the last successful load.
+
+        This method compares the current `input_fingerprint` of the path against the `.etlstate` sidecar file 
+        written by `save_input_state`. If there is no sidecar, or any file was added, removed or changed, the input 
+        is treated as changed.
+
+        :param path: A string containing the path to the input file or folder.
+        :return: A boolean indicating whether the input is unchanged.
+
+    """
+    def input_unchanged(self, path):
+
+        # Construct the path of the sidecar state file next to the input
+        state_path = path.rstrip('\\/') + '.etlstate'
+
+        # Treat a missing or unreadable sidecar as a changed input
+        try:
+            with open(state_path, 'rb') as f:
+                state = _json_loads(f.read())
+        except (OSError, ValueError):
+            return False
+
+        # Compare the fingerprint of the matching files against the saved state
+        return state == self.input_fingerprint(path)
+
+
+    """
+        Records the fingerprint of the input files under a file or folder path after a successful load.
+
+        This method writes the fingerprint returned by process_file to a `.etlstate` sidecar file next to the input, 
+        which `input_unchanged` reads on the next run. The fingerprint is the one taken before the files were loaded 
+        and archived, so files that arrive during the run are not recorded as loaded. Only call it once every file 
+        has loaded successfully.
+
+        :param path: A string containing the path to the input file or folder.
+        :param fingerprint: A dictionary containing the fingerprint returned by process_file.
+
+    """
+    def save_input_state(self, path, fingerprint):
+
+        # Construct the path of the sidecar state file next to the input and write the fingerprint to it
+        state_path = path.rstrip('\\/') + '.etlstate'
+        with open(state_path, 'w') as f:
+            f.write(_json_dumps(fingerprint))
 
 
     """
@@ -258,7 +942,8 @@ class ETLProcess:
     """
         Downloads a file from a given URL and saves it to a specified location.
 
-        This method sends a GET request to the provided URL and writes the response content to a file.
+        This method sends a GET request through the pooled HTTP session and streams the response body to a file 
+        in 1 MiB chunks, so the file is never held in memory as a whole.
         If the HTTP request returns an unsuccessful status code, it raises an HTTPError.
         If the URL is invalid, it logs an error message.
 
@@ -271,15 +956,32 @@ class ETLProcess:
 
         # Attempt to download a file from the given URL and save it to the target file
         try:
-            # Send a GET request to the URL
-            response = requests.get(url)
-            # Raise an exception if the response contains an HTTP error status code
-            response.raise_for_status()  
+            # Send a streaming GET request to the URL
+            with self._http.get(url, stream=True, timeout=(5, 60)) as response:
+                # Raise an exception if the response contains an HTTP error status code
+                response.raise_for_status()
+                # Undo any gzip/deflate content encoding while reading the raw stream
+                response.raw.decode_content = True
+
+                # For large uncompressed bodies of known size, reserve the file's space up front so the filesystem can
+                # allocate it in as few extents as possible, instead of growing the file one write at a time
+                size = int(response.headers.get('Content-Length', '0'))
+                if size > 64 * 1024 * 1024 and hasattr(os, 'posix_fallocate') and 'Content-Encoding' not in response.headers:
+                    fd = os.open(targetFile, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+                    try:
+                        os.posix_fallocate(fd, 0, size)
+                    except OSError:
+                        # Some filesystems do not support preallocation; the copy below still works without it
+                        pass
+                    f = os.fdopen(fd, 'wb', buffering=1024 * 1024)
+                else:
+                    # Open the target file in write-binary mode
+                    f = open(targetFile, 'wb')
 
-            # Open the target file in write-binary mode
-            with open(targetFile, 'wb') as f:
-                # Write the content of the response to the file
-                f.write(response.content)
+                # Copy the response body to the file, then trim any preallocated space left over by a short body
+                with f:
+                    shutil.copyfileobj(response.raw, f, length=1024 * 1024)
+                    f.truncate()
 
             # Log a message indicating that the file was downloaded successfully
             logging.info(f"File downloaded: {targetFile}")
@@ -304,44 +1006,32 @@ class ETLProcess:
 
     def download_from_s3(self, s3_bucket, s3_folder, destination_folder):
 
-        # Initialize the S3 client
-        s3 = boto3.client('s3')
+        # Get the shared S3 client
+        s3 = _s3()
 
-        # List objects in the specified S3 bucket
-        objects = s3.list_objects_v2(Bucket=s3_bucket, Prefix=s3_folder)
-        files = [item['Key'] for item in objects['Contents'] if not item['Key'].endswith('/')]
+        # Build the filter once: the file name prefix and the set of accepted extensions, without their dots
+        prefix = self.file_prefix
+        exts = frozenset(ext.strip().lstrip('.') for ext in self.file_extensions.split(','))
 
-        # Initialize a list to hold the file name and extensions
-        files_without_folders = []
-        file_extensions = []        
+        # List objects in the specified S3 bucket, following the paginator past the 1000-key page limit, and collect
+        # (key, destination path) pairs for the files whose name matches the prefix and extension in a single pass
+        paginator = s3.get_paginator('list_objects_v2')
+        pairs = []
+        for key in (item['Key'] for page in paginator.paginate(Bucket=s3_bucket, Prefix=s3_folder) for item in page.get('Contents', [])):
+            # Take the last part of the key to get the file name without folder prefix; folder keys give an empty name
+            file_name = key.rpartition('/')[2]
+            if file_name.startswith(prefix) and file_name.rpartition('.')[2] in exts:
+                pairs.append((s3_folder + file_name, os.path.join(destination_folder, file_name)))
 
-        # Iterate over the files, extract the file names without folder prefixes and their extensions
-        for file in files:
-            if not file.endswith('/'):
-                # Split the key by '/' and take the last part to get the file name without folder prefix
-                file_name = file.split('/')[-1]
-                files_without_folders.append(file_name) 
+        # Copy a single file from S3 to the local destination, using multipart ranged GETs for large objects
+        def download(pair):
+            key, destination_path = pair
+            s3.download_file(s3_bucket, key, destination_path, Config=_S3_TRANSFER_CONFIG)
+            print(f"Copied s3://{s3_bucket}{key} to {destination_path}")
 
-                # Use os.path.splitext to get the file extension and add it to the list
-                _, file_extension = os.path.splitext(file_name)
-                file_extensions.append(file_extension)                
-
-        # Filter files based on prefix and extension, then download matching files from S3 to the local destination
-        for file_name in files_without_folders:
-
-            # Check if the object key starts with the desired prefix
-            if file_name.startswith(self.file_prefix):
-                # Check if the file extension matches the desired extensions
-                _, file_extension = os.path.splitext(file_name)  
-                
-                # If the file extension matches the desired extensions, construct the destination path for the file
-                file_extension = file_extension[1:]  # Remove the prefixed dot             
-                if file_extension in self.file_extensions:
-                    destination_path = os.path.join(destination_folder, file_name)
-
-                    # Copy the file from S3 to the local destination
-                    s3.download_file(s3_bucket, s3_folder+file_name, destination_path)
-                    print(f"Copied s3://{s3_bucket}{s3_folder}{file_name} to {destination_path}")
+        # Download the matching files concurrently; list() re-raises the first failed download
+        with ThreadPoolExecutor(max_workers=16) as executor:
+            list(executor.map(download, pairs))
 
 
     """
@@ -362,56 +1052,79 @@ class ETLProcess:
     """
     def download_from_sftp(self, host, port, username, password, remote_path, local_path):
         
-        # Create an SSH client instance
-        ssh = paramiko.SSHClient()
-        # Set the policy to automatically add the server's host key (prevents needing to manually add it)
-        ssh.set_missing_host_key_policy(paramiko.AutoAddPolicy())
+        transport = None
+        channels = []
 
         try:
-            # Connect to the SFTP server using the provided host, port, username, and password
-            ssh.connect(host, port, username, password)
+            # Open the transport with a 4 MiB window and 32 KiB packets so more bytes are in flight per round trip
+            transport = paramiko.Transport((host, port))
+            transport.default_window_size = 4 * 1024 * 1024
+            transport.default_max_packet_size = 32768
+            transport.connect(username=username, password=password)
 
-            # Create an SFTP client from the SSH client
-            sftp = ssh.open_sftp()
+            # Create an SFTP client from the transport
+            sftp = paramiko.SFTPClient.from_transport(transport)
+            channels.append(sftp)
 
             # List all files in the remote directory
             files = sftp.listdir(remote_path)
 
-            # Split the extensions string into a list
-            extensionList = [ext.strip() for ext in self.file_extensions.split(',')]
+            # Build the filter once: the file name prefix and a tuple of accepted suffix and extension endings
+            prefix = self.file_prefix
+            endings = tuple(f"{self.file_suffix}.{ext.strip().lstrip('.')}" for ext in self.file_extensions.split(','))
 
             # Filter files based on prefix and any of the extensions
-            filtered_files = [f for f in files if f.startswith(self.file_prefix) or any(f.endswith(self.file_suffix + '.' + ext) for ext in extensionList)]
-
-            # Download each filtered file
-            for file_name in filtered_files:
-                remote_file_path = os.path.join(remote_path, file_name)
-                local_file_path = os.path.join(local_path, file_name)
-                sftp.get(remote_file_path, local_file_path)
-                print(f"Downloaded {file_name} to {local_path}")
-
-                #Check if the file is a ZIP file and unzip it
-                if zipfile.is_zipfile(local_file_path):
-                   with zipfile.ZipFile(local_file_path, 'r') as zip_ref:
-                       # Define an extraction path (can customize or use same directory)
-                       extract_path = os.path.join(local_path, os.path.splitext(file_name)[0])
-                       zip_ref.extractall(extract_path)
-                       print(f"Extracted {file_name} to {extract_path}")
+            filtered_files = [f for f in files if f.startswith(prefix) or f.endswith(endings)]
+
+            # Open up to eight SFTP channels over the same transport, one per download worker
+            while len(channels) < min(8, len(filtered_files)):
+                channels.append(paramiko.SFTPClient.from_transport(transport))
+
+            # Download a share of the filtered files over one channel, returning the ZIP files found
+            def download(channel, file_names):
+                found = []
+                for file_name in file_names:
+                    remote_file_path = os.path.join(remote_path, file_name)
+                    local_file_path = os.path.join(local_path, file_name)
+                    channel.get(remote_file_path, local_file_path)
+                    print(f"Downloaded {file_name} to {local_path}")
+
+                    #Check if the file is a ZIP file and queue it for extraction
+                    if zipfile.is_zipfile(local_file_path):
+                        # Define an extraction path (can customize or use same directory)
+                        extract_path = os.path.join(local_path, os.path.splitext(file_name)[0])
+                        found.append((local_file_path, extract_path))
+                return found
+
+            # Distribute the files round-robin across the channels, collecting the ZIP files to extract once all downloads are done
+            zip_files = []
+            with ThreadPoolExecutor(max_workers=len(channels)) as executor:
+                futures = [executor.submit(download, channel, filtered_files[i::len(channels)]) for i, channel in enumerate(channels)]
+                for future in futures:
+                    zip_files.extend(future.result())
+
+            # Decompression is CPU-bound and each archive is independent, so extract them in parallel processes
+            if zip_files:
+                with ProcessPoolExecutor() as executor:
+                    for zip_path, extract_path in executor.map(_extract_zip, *zip(*zip_files)):
+                        print(f"Extracted {os.path.basename(zip_path)} to {extract_path}")
 
         except Exception as e:
             print(f"Failed to download files: {e}")
         finally:
-            # Close the SFTP session and client
-            sftp.close()
-            ssh.close()
+            # Close the SFTP channels and the transport
+            for channel in channels:
+                channel.close()
+            if transport is not None:
+                transport.close()
 
     """
         Extracts the contents of a file if it is a ZIP file.
 
-        This method checks if the file at the provided path is a ZIP file. If it is, it extracts the contents 
-        of the ZIP file to the same directory. It then checks if a file with the same name already exists in 
-        the archive directory. If it does, it deletes the existing file. Finally, it moves the ZIP file to the 
-        archive directory.
+        This method checks the file's signature with `zipfile.is_zipfile`, so archives are recognized regardless of 
+        their extension. If it is a ZIP file, its members are streamed to the same directory on a small thread pool, 
+        which overlaps decompression with disk writes. Finally, it moves the ZIP file to the archive directory, 
+        replacing any file with the same name already there.
 
         :param file_path: A string containing the path to the file to be extracted.
 
@@ -419,24 +1132,19 @@ class ETLProcess:
     def extract_file_if_compressed(self, file_path):
 
         # Check if the file is a zip file
-        if os.path.splitext(file_path)[1] == '.zip':
+        if zipfile.is_zipfile(file_path):
             # If it is, open the zip file in read mode
             with zipfile.ZipFile(file_path, 'r') as zip_ref:
-                # Extract all files in the zip file to the same directory as the zip file
-                zip_ref.extractall(os.path.dirname(file_path))
+                # Extract the members to the same directory as the zip file, several at a time
+                dest_dir = os.path.dirname(file_path)
+                with ThreadPoolExecutor(max_workers=4) as executor:
+                    list(executor.map(lambda member: _extract_member(zip_ref, member, dest_dir), zip_ref.infolist()))
             # Log a message indicating that the zip file has been extracted
             logging.info(f"Extracted {file_path}")
 
-            # Construct the path where the zip file will be moved to after extraction
-            dest_file_path = os.path.join(self.archive_path, os.path.basename(file_path))
-
-            # If a file already exists at the destination path, remove it
-            if os.path.exists(dest_file_path):
-                os.remove(dest_file_path)
-
-            # Move the zip file to the archive folder
+            # Move the zip file to the archive folder, replacing any existing copy
             print(f"Moving {file_path} to the archive folder {self.archive_path} ...")
-            shutil.move(file_path, self.archive_path)
+            self.move_to_archive(file_path, self.archive_path)
  
 
     """
@@ -455,26 +1163,29 @@ class ETLProcess:
         # Assign the field delimiter from the ETL configuration to a local variable     
         delimiter = self.field_delimiter
 
-        # If the delimiter is a tab, replace it with a string representation of a tab for compatibility
-        if delimiter == '\t':
-            delimiter = '"\\t"' 
+        # Build the BCP argument list with the appropriate parameters for database, table, file path, batch size, delimiter, server, and end of row character.
+        # No shell is involved, so the values are passed through verbatim, with control characters in their escaped form such as \t and \n
+        args = ['bcp', f'{self.dbName}.dbo.{tableName}_View', 'in', file_path, '-F', str(self.bcp_row_start), '-c',
+                '-b', str(self.bcp_batch_commit_size), '-t', _escape(delimiter), '-S', self.dbServer, '-r', _escape(self.bcp_end_of_row)]
 
-        # Construct the BCP command string with the appropriate parameters for database, table, file path, batch size, delimiter, server, and end of row character
-        bcp_command = f"bcp {self.dbName}.dbo.{tableName}_View IN {file_path} -F {self.bcp_row_start} -c \
-            -b {self.bcp_batch_commit_size} -t{delimiter} -S {self.dbServer} -r {self.bcp_end_of_row} "
-        
-        # If a user ID is provided, add it and the password to the BCP command; otherwise, add the trusted connection flag
+        # If a user ID is provided, add it and the password to the BCP arguments; otherwise, add the trusted connection flag
         if self.uid>'':
-            bcp_command += f"-U {self.uid} -P {self.pwd}"
+            args += ['-U', self.uid, '-P', self.pwd]
         else:        
-            bcp_command += "-T" 
+            args.append('-T')
 
-        # Execute the BCP command using a subprocess, handling and logging any exceptions that occur
+        # Execute BCP directly, treating a non-zero exit code as a failure and logging its output
         try:
-            subprocess.run(bcp_command, shell=True)
-        except Exception as e:
+            result = subprocess.run(args, check=True, capture_output=True, text=True)
+        except subprocess.CalledProcessError as e:
+            logging.error(f"BCP import failed with exit code {e.returncode}: {e.stderr or e.stdout}")
+            print(f'BCP import failed: {e}')
+            raise
+        except OSError as e:
             print(f'BCP import failed: {e}')
+            raise
         else:
+            logging.info(result.stdout)
             print('BCP import succeeded')
 
 
@@ -486,7 +1197,8 @@ class ETLProcess:
         batch commit size, end of row character, and database server. If a user ID and password are provided, 
         they are included in the command; otherwise, the command uses trusted connection (-T option).
 
-        If the BCP command fails, it logs an error message. If it succeeds, it logs a success message.
+        If the BCP command fails, it logs an error message and raises the exception, so the file is not recorded as 
+        loaded or archived. If it succeeds, it logs a success message.
 
         :param file_path: A string containing the path to the file to be imported.
         :param tableName: A string containing the name of the database table where the data should be imported.
@@ -503,8 +1215,8 @@ class ETLProcess:
         BULK INSERT {tableName}
         FROM '{file_path}'
         WITH (
-            FIELDTERMINATOR = '{self.field_delimiter}',
-            ROWTERMINATOR = '{self.bcp_end_of_row}',
+            FIELDTERMINATOR = '{_escape(self.field_delimiter)}',
+            ROWTERMINATOR = '{_escape(self.bcp_end_of_row)}',
             FIRSTROW = {self.bcp_row_start},
             BATCHSIZE = {self.bcp_batch_commit_size}
         )
@@ -516,131 +1228,579 @@ class ETLProcess:
             conn.commit()
         except pyodbc.Error as e:
             print(f'BULK INSERT failed: {e}')
+            raise
         else:
             print('BULK INSERT succeeded')
         finally:
             cursor.close()
             conn.close()        
 
+    """
+        Imports data into a SQL Server database using the native TDS bulk copy protocol.
+
+        This method reads the rows of a delimited file and streams them to SQL Server with mssql-python's 
+        `cursor.bulkcopy`, which sends the data as a bulk load instead of one parameterized statement per row. 
+        The batch size and table lock are taken from the `bulkcopy_batch_size` and `bulkcopy_table_lock` 
+        settings of the MSSQL configuration.
+
+        The rows are streamed from the file rather than read into memory first. If mssql-python is not installed or 
+        its connection cannot be opened, nothing has been sent yet, so it logs a warning and falls back to pyodbc's 
+        `fast_executemany` insert path. A failure once the bulk copy has started is raised instead, since batches it 
+        already committed would otherwise be inserted a second time by the fallback.
+
+        :param file_path: A string containing the path to the file to be imported.
+        :param tableName: A string containing the name of the database table where the data should be imported.
+        :return: An integer containing the number of rows imported.
+    
+    """
+    def bulkcopy_import(self, file_path, tableName):
+
+        # Define a generator that reads the rows of the file, skipping the header row if the file has one
+        def read_rows():
+            with open(file_path, 'r', newline='') as csvfile:
+                reader = csv.reader(csvfile, delimiter=self.field_delimiter, quoting=csv.QUOTE_MINIMAL)
+                if self.file_has_header:
+                    next(reader, None)
+                for row in reader:
+                    yield tuple(row)
+
+        # Get the target column names from the view, which excludes the identity column
+        conn = self.connect_to_database()
+        cursor = conn.cursor()
+        try:
+            columns = self.view_columns(cursor, tableName)
+        finally:
+            cursor.close()
+            conn.close()
+
+        bulk_conn = None
+        try:
+            # Bulk copy is only available through mssql-python
+            if mssql_python is None:
+                raise ImportError("mssql-python is not installed")
+
+            # Construct a connection string for mssql-python using the same credentials as pyodbc
+            conn_str = f'SERVER={self.dbServer};DATABASE={self.dbName};'
+            if self.uid and self.pwd:
+                conn_str += f'UID={self.uid};PWD={self.pwd}'
+            else:
+                conn_str += 'Trusted_Connection=yes;'
+            bulk_conn = mssql_python.connect(conn_str)
+
+        except Exception as e:
+            # Nothing has been sent yet, so log a warning and fall back to pyodbc's fast_executemany path
+            logging.warning(f"Bulk copy unavailable, falling back to fast_executemany: {e}")
+
+            conn = self.connect_to_database()
+            cursor = conn.cursor()
+            cursor.fast_executemany = True
+            try:
+                # Insert the rows through the view in batches of the configured size, reading one batch at a time
+                query = f"INSERT INTO {tableName}_View ({', '.join(f'[{column}]' for column in columns)}) VALUES ({', '.join('?' * len(columns))})"
+                rows = read_rows()
+                num_rows = 0
+                while batch := list(itertools.islice(rows, self.bulkcopy_batch_size)):
+                    cursor.executemany(query, batch)
+                    num_rows += len(batch)
+                conn.commit()
+                logging.info(f"Inserted {num_rows} rows from {file_path} to {tableName} with fast_executemany.")
+            finally:
+                cursor.close()
+                conn.close()
+            return num_rows
+
+        # Stream the rows to the base table, mapping each source ordinal to its target column and counting them as they are read
+        num_rows = 0
+        def counted_rows():
+            nonlocal num_rows
+            for row in read_rows():
+                num_rows += 1
+                yield row
+
+        try:
+            bulk_cursor = bulk_conn.cursor()
+            bulk_cursor.bulkcopy(tableName, counted_rows(),
+                                 column_mappings=list(enumerate(columns)),
+                                 table_lock=self.bulkcopy_table_lock,
+                                 batch_size=self.bulkcopy_batch_size)
+            bulk_conn.commit()
+        finally:
+            bulk_conn.close()
+
+        logging.info(f"Bulk copied {num_rows} rows from {file_path} to {tableName}.")
+        return num_rows
+
+
     """
         Imports data into a SQL Server database using pandas.
 
-        This method reads data from a file into a pandas DataFrame, converts the data to the appropriate types, 
-        and then inserts the data into a SQL Server database table. It uses the existing database connection method 
+        This method reads data from a file into pandas DataFrames in chunks of `batch_size` rows, converts the data 
+        to the appropriate types, and then inserts each chunk into a SQL Server database table. It uses the existing database connection method 
         to connect to the database.
 
         The method handles various data formats, such as values enclosed in parentheses (which are converted to negative), 
         "-" (which is converted to None), and "<NA>" (which is also converted to None).
 
-        If the import fails, it logs an error message. If it succeeds, it logs a success message and prints the number 
-        of rows imported.
+        If `fast_csv_reader` is enabled and the configuration has no SCHEMA section, the file is instead read with 
+        `csv.reader` and each row is cleaned as it is read, which skips building a DataFrame for every chunk. That path 
+        only treats empty values, "-", and "<NA>" as NULL, rather than every default pandas missing-value marker such as 
+        "NA" or "NULL", and loads every value as text rather than inferring types. The method returns immediately if 
+        pandas import is not enabled.
+
+        If the import fails, it prints an error message and raises the exception. If it succeeds, it logs a success 
+        message, prints the number of rows imported and returns it.
 
         :param file_path: A string containing the path to the file to be imported.
         :param tableName: A string containing the name of the database table where the data should be imported.
     
     """
     def pandas_import(self, file_path, tableName):
+
+        # Nothing to do unless pandas import is enabled
+        if not self.pandas_import_bool:
+            return None
         
         try:
-            # Replace any double quotes in the field delimiter and use it to read the file into a pandas DataFrame
+            # Replace any double quotes in the field delimiter
             delimiter = self.field_delimiter.replace('"', '')
-            df = pd.read_csv(file_path, delimiter=delimiter, engine='python')
-
-            # Define a function to convert string values to appropriate data types, handling optional double quotes, negative values enclosed in parentheses, and missing values represented as "-" or "<NA>"
-            def convert_values(val):
-                if isinstance(val, str):
-                    val = val.strip('"')            # Remove optional double quotes
-                    if val.startswith("(") and val.endswith(")"):
-                        return -float(val[1:-1])    # Convert values enclosed in parentheses to negative
-                    elif val == "-":
-                        return None                 # Convert "-" to None
-                    elif val == "<NA>":
-                        return None                 # Convert "<NA>" to None
-                    # add other conditions as needed
-                return val                          # Return the original value
-            
-            # Apply the function to each column in the DataFrame
-            df = df.apply(lambda col: col.apply(convert_values)).convert_dtypes()
-
-            # Convert the DataFrame's data types to string
-            df = df.astype(str)
-
-            # Replace "<NA>" with None
-            # df.replace("<NA>", None, inplace=True)
 
             # Use the existing database connection method
             conn = self.connect_to_database()
 
-            # Create a cursor from the connection
+            # Create a cursor from the connection, letting the ODBC driver send parameter arrays in one round trip
             cursor = conn.cursor()
+            cursor.fast_executemany = True
 
             # Get the column names from the SQL Server table
-            cursor.execute(f"SELECT COLUMN_NAME FROM INFORMATION_SCHEMA.COLUMNS WHERE TABLE_NAME = '{tableName}_View' ORDER BY ORDINAL_POSITION")
-            columns = ', '.join([f'[{row[0]}]' for row in cursor.fetchall()])
-
-            # Create an insert query
-            query = f"INSERT INTO {tableName}_View ({columns}) VALUES ({', '.join('?' * len(df.columns))})"
-
-            # Create a list of tuples from the DataFrame rows
-            data = [tuple(row) for row in df.values]
-
-            # Execute the query with the data
-            cursor.executemany(query, data)
-
-            # Get the number of rows in the DataFrame
-            num_rows = len(df)
+            columns = self.view_columns(cursor, tableName)
+
+            # Parse and clean chunks on a background thread while this thread inserts them, so parsing overlaps the
+            # database round trips. The bounded queue keeps at most two parsed chunks in memory at a time.
+            chunk_queue = queue.Queue(maxsize=2)
+            stop = threading.Event()
+
+            # Define a function that hands an item to the loader, giving up if the loader has stopped
+            def hand_off(item):
+                while not stop.is_set():
+                    try:
+                        chunk_queue.put(item, timeout=1)
+                        return True
+                    except queue.Full:
+                        continue
+                return False
+
+            # Define a generator that reads the file with pandas, yielding each cleaned chunk as a list of row tuples
+            def read_frames():
+                # Stream the file in chunks of the configured batch size with the C parser, so memory stays bounded by the chunk.
+                # The file is memory-mapped so the parser reads pages directly instead of copying through a read buffer.
+                # Columns listed in the SCHEMA section skip type inference, and date columns are parsed while reading.
+                # When pyarrow is installed the columns are Arrow-backed, so text is held in contiguous buffers rather than Python strings
+                backend = {'dtype_backend': 'pyarrow'} if pa is not None else {}
+                for df in pd.read_csv(file_path, delimiter=delimiter, engine='c', chunksize=self.batch_size, memory_map=True,
+                                      dtype=self.schema or None, parse_dates=self.date_columns or False,
+                                      date_format=self.date_format, cache_dates=True, low_memory=False, **backend):
+
+                    # Note the NumPy object columns before the Arrow-backed text columns are cleaned into object columns
+                    object_columns = df.select_dtypes(include='object').columns
+
+                    # Clean Arrow-backed text columns with pyarrow compute kernels
+                    for column in df.columns:
+                        dtype = df[column].dtype
+                        if isinstance(dtype, pd.ArrowDtype) and (pa.types.is_string(dtype.pyarrow_dtype) or pa.types.is_large_string(dtype.pyarrow_dtype)):
+                            df[column] = _clean_arrow_strings(df[column])
+
+                    # Clean every remaining text column with vectorized operations instead of a per-cell Python function
+                    for column in object_columns:
+                        # Remove optional double quotes
+                        stripped = df[column].str.strip('"').to_numpy()
+
+                        # Convert numbers enclosed in parentheses to negative numbers, matching the column in a single pass
+                        matches = _match_paren(stripped)
+                        negatives = np.fromiter((-float(m.group(1)) if m else np.nan for m in matches), dtype=np.float64, count=len(stripped))
+                        df[column] = np.where(np.not_equal(matches, None), negatives, stripped)
+
+                    # Convert "-" and "<NA>" to missing values, then let pandas pick the best types
+                    df = df.replace({'-': pd.NA, '<NA>': pd.NA}).convert_dtypes()
+
+                    # Keep the native types so pyodbc binds numbers and dates directly, and send missing values as NULL
+                    df = df.astype(object).where(df.notna(), None)
+
+                    yield list(df.itertuples(index=False, name=None))
+
+            # Define a generator that reads the file with csv.reader, yielding lists of cleaned row tuples of the batch size
+            def read_rows():
+                with open(file_path, 'r', newline='', encoding='utf-8') as csvfile:
+                    reader = csv.reader(csvfile, delimiter=delimiter)
+                    # Skip the header row, as pandas would
+                    next(reader, None)
+                    batch_size = self.batch_size
+                    width = len(columns)
+                    padding = (None,) * width
+                    rows = []
+                    for row in reader:
+                        # Skip blank lines, which csv.reader returns as empty rows, as pandas would
+                        if not row:
+                            continue
+                        # Pad short rows with NULLs as pandas would, and reject rows with more fields than columns
+                        if len(row) > width:
+                            raise ValueError(f"Expected {width} fields in line {reader.line_num}, saw {len(row)}")
+                        rows.append((tuple(map(_clean_csv_value, row)) + padding)[:width])
+                        if len(rows) >= batch_size:
+                            yield rows
+                            rows = []
+                    if rows:
+                        yield rows
+
+            # Define the parser, which puts lists of row tuples on the queue, then None when done or the exception on failure
+            def parse_chunks():
+                try:
+                    # When opted in and there are no configured column types, skip the DataFrame and keep the values as text
+                    chunks = read_rows() if self.fast_csv_reader and not (self.schema or self.date_columns) else read_frames()
+                    for rows in chunks:
+                        # Hand the chunk's rows to the loader
+                        if not hand_off(rows):
+                            return
+                    hand_off(None)
+                except Exception as e:
+                    hand_off(e)
+
+            # Start the parser thread
+            parser = threading.Thread(target=parse_chunks, daemon=True)
+            parser.start()
+
+            # Insert each chunk as it arrives; all chunks share a single transaction
+            num_rows = 0
+            try:
+                while True:
+                    rows = chunk_queue.get()
+                    if rows is None:
+                        break
+                    if isinstance(rows, Exception):
+                        raise rows
+
+                    # Insert the chunk as executemany parameter arrays
+                    self.insert_rows(cursor, f"{tableName}_View", columns, rows)
+
+                    # Keep a running count of the rows inserted
+                    num_rows += len(rows)
+            finally:
+                # Signal the parser to stop if the loader exits early
+                stop.set()
 
             # Print the number of rows imported
             print(f'{num_rows} rows were imported.')
 
-            # Commit the changes
+            # Commit all batches at once
             conn.commit()
             logging.info(f"Pandas data from {file_path} inserted successfully.")
 
         except Exception as e:
             print(f'Pandas import failed: {e}')
+            raise
         else:
             print('Pandas import succeeded')
+            return num_rows
         finally:
             # Close the cursor and connection
             cursor.close()
             conn.close()
 
 
+    """
+        Imports data into a SQL Server database using pyarrow's CSV reader.
+
+        This method parses the file with `pyarrow.csv.open_csv`, which tokenizes in C on multiple threads and yields 
+        columnar record batches of about 64 MiB each. Each batch is turned into rows and inserted into the table's view 
+        with `fast_executemany`, so only one batch is held in memory at a time and no pandas DataFrame is built.
+
+        String columns get the same cleaning as in pandas_import: optional double quotes are removed, numbers enclosed 
+        in parentheses are converted to negative numbers, and empty values, "-", and "<NA>" are converted to None.
+
+        If pyarrow is not installed, it raises an ImportError.
+
+        :param file_path: A string containing the path to the file to be imported.
+        :param tableName: A string containing the name of the database table where the data should be imported.
+        :param reader: An optional reader from `open_arrow_csv` that is already open on the file, such as the one 
+                       handle_csv used to read the header. Defaults to opening a new reader.
+        :return: An integer containing the number of rows imported.
+
+    """
+    def arrow_import(self, file_path, tableName, reader=None):
+
+        # The Arrow import method requires pyarrow
+        if pacsv is None:
+            raise ImportError("pyarrow is required for the arrow import method")
+
+        # Establish a connection to the database and create a cursor that sends parameter arrays in one round trip
+        conn = self.connect_to_database()
+        cursor = conn.cursor()
+        cursor.fast_executemany = True
+
+        try:
+            # Get the column names from the SQL Server view, which excludes the identity column
+            columns = self.view_columns(cursor, tableName)
+
+            # Open a streaming, multithreaded reader over the file unless one was passed in
+            if reader is None:
+                reader = self.open_arrow_csv(file_path)
+
+            # Insert each record batch as it is parsed; all batches share a single transaction
+            num_rows = 0
+            for batch in reader:
+                # Clean the string columns with compute kernels; the columns pyarrow typed while parsing are used as they are
+                values = [_clean_arrow_array(column) if pa.types.is_string(column.type) or pa.types.is_large_string(column.type) 
+                          else column.to_pylist() for column in batch.columns]
+                rows = list(zip(*values))
+                self.insert_rows(cursor, f"{tableName}_View", columns, rows)
+                num_rows += batch.num_rows
+
+            # Commit all batches at once
+            conn.commit()
+            logging.info(f"Arrow data from {file_path} inserted successfully ({num_rows} rows).")
+            return num_rows
+
+        except Exception:
+            # Roll back the transaction in case of error
+            conn.rollback()
+            raise
+
+        finally:
+            # Close the cursor and the connection
+            cursor.close()
+            conn.close()
+
+
+    """
+        Opens a streaming pyarrow CSV reader over a file.
+
+        The reader tokenizes in C on multiple threads in 64 MiB blocks. The schema, including the column names, is 
+        available from the reader before any batch is consumed, so the same reader can supply the header and then 
+        the data.
+
+        :param file_path: A string containing the path to the file to be read.
+        :return: A pyarrow.csv.CSVStreamingReader over the file.
+
+    """
+    def open_arrow_csv(self, file_path):
+        return pacsv.open_csv(
+            file_path,
+            read_options=pacsv.ReadOptions(block_size=64 << 20, use_threads=True, autogenerate_column_names=not self.file_has_header),
+            parse_options=pacsv.ParseOptions(delimiter=self.field_delimiter),
+            # Read empty values in string columns as nulls, as pandas does
+            convert_options=pacsv.ConvertOptions(strings_can_be_null=True),
+        )
+
+
+    """
+        Returns the column names of a table's view, in ordinal order.
+
+        The names are read from INFORMATION_SCHEMA.COLUMNS the first time a view is seen and cached per server, 
+        database, and table, so loading many files into the same table queries the catalog only once. The cache 
+        entry is dropped whenever create_table_and_view recreates the table.
+
+        :param cursor: A pyodbc.Cursor object used to query the catalog on a cache miss.
+        :param tableName: A string containing the name of the database table whose view is queried.
+        :return: A list containing the column names of the view.
+
+    """
+    def view_columns(self, cursor, tableName):
+
+        # Return the cached column list if the view has been seen before
+        key = (self.dbServer, self.dbName, tableName)
+        columns = self._col_cache.get(key)
+        if columns is None:
+            # Get the column names from the SQL Server view and remember them
+            cursor.execute(f"SELECT COLUMN_NAME FROM INFORMATION_SCHEMA.COLUMNS WHERE TABLE_NAME = '{tableName}_View' ORDER BY ORDINAL_POSITION")
+            columns = [row[0] for row in cursor.fetchall()]
+            self._col_cache[key] = columns
+        return columns
+
+
+    """
+        Inserts rows into a database table in batches.
+
+        The rows are sent with `executemany` in slices of `batch_size`. The callers enable pyodbc's `fast_executemany` 
+        on the cursor, so the ODBC driver packs each slice into parameter arrays sent in a single round trip.
+
+        :param cursor: A pyodbc.Cursor object with `fast_executemany` enabled, used to execute the statements.
+        :param tableName: A string containing the name of the database table or view to insert into.
+        :param columns: A list containing the names of the columns to insert into.
+        :param rows: A list of tuples containing the values of each row, in column order.
+
+    """
+    def insert_rows(self, cursor, tableName, columns, rows):
+
+        # Build the parameterized INSERT statement for a single row once
+        column_list = ', '.join(f'[{column}]' for column in columns)
+        query = f"INSERT INTO {tableName} ({column_list}) VALUES ({', '.join('?' * len(columns))})"
+
+        # Send parameter arrays of batch_size rows per call
+        for start in range(0, len(rows), self.batch_size):
+            cursor.executemany(query, rows[start:start + self.batch_size])
+
+
+    """
+        Returns the calling thread's reused database connection, opening it on first use.
+
+        Each thread gets its own connection, since a pyodbc connection must not be used by two threads at once. 
+        The connections stay open across files until `close_connections` is called.
+
+        :return: A database connection from `connect_to_database`.
+
+    """
+    def _get_conn(self):
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = self.connect_to_database()
+            self._local.conn = conn
+            with self._conns_lock:
+                self._conns.append(conn)
+        return conn
+
+
+    """
+        Closes every connection opened by `_get_conn`, returning them to the pool.
+
+        Threads that call `_get_conn` afterwards open a new connection.
+
+    """
+    def close_connections(self):
+        with self._conns_lock:
+            conns, self._conns = self._conns, []
+            self._local = threading.local()
+        for conn in conns:
+            conn.close()
+
+
     """
         Connects to a database based on the database type and credentials specified in the ETL configuration.
 
-        This method constructs a connection string based on the database type, server, name, user ID, and password.
-        If the database type is 'mssql', it uses the pyodbc library to connect to the SQL Server database. If the user ID 
-        and password are provided, they are included in the connection string; otherwise, the connection string specifies 
-        a trusted connection.
+        If the database type is 'mssql', this method checks out a connection from the SQLAlchemy engine created in 
+        `__init__`, whose pyodbc connection string includes the user ID and password when they are provided and 
+        specifies a trusted connection otherwise. The pool holds up to five connections and pings them before reuse, 
+        so callers skip the TCP handshake and login. Closing the returned connection returns it to the pool.
 
         If the database type is not 'mssql', it raises a ValueError.
 
-        :return: A pyodbc.Connection object representing the database connection.
+        :return: A pooled DBAPI connection proxying a pyodbc.Connection.
     
     """
     def connect_to_database(self):
 
        # Check if the database type is 'mssql'
         if self.db_type == 'mssql':
-            # Construct a connection string for a SQL Server database using provided server and database names          
-            conn_str = f'DRIVER={{SQL Server}};SERVER={self.dbServer};DATABASE={self.dbName};'
-            
-            # If user ID and password are provided, add them to the connection string
-            if self.uid and self.pwd:
-                conn_str += f'UID={self.uid};PWD={self.pwd}'
-            else:
-                # If user ID and password are not provided, use a trusted connection
-                conn_str += 'Trusted_Connection=yes;'
-            
-            # Return a pyodbc connection object using the constructed connection string
-            return pyodbc.connect(conn_str)
+            # Return a pyodbc connection checked out from the engine's pool
+            return self.engine.raw_connection()
         else:
             # If the database type is not 'mssql', raise a ValueError
             raise ValueError("Unsupported database type")        
 
 
+    """
+        Moves a processed file into an archive folder.
+
+        The file is renamed into place with `os.replace`, which is a single metadata update and overwrites any 
+        existing archived copy. If the archive folder is on another device the rename fails with EXDEV, and it falls 
+        back to `shutil.move`, which copies the file across devices and then removes the original.
+
+        :param file_path: A string containing the path to the file to be archived.
+        :param archive_path: A string containing the path to the archive folder.
+        :return: A string containing the path of the archived file.
+
+    """
+    def move_to_archive(self, file_path, archive_path):
+
+        # Construct the destination path inside the archive folder
+        dest_path = os.path.join(archive_path, os.path.basename(file_path))
+
+        # Rename in place, and only copy when the archive folder is on another device
+        try:
+            os.replace(file_path, dest_path)
+        except OSError as e:
+            if e.errno != errno.EXDEV:
+                raise
+            shutil.move(file_path, dest_path)
+
+        return dest_path
+
+
+    """
+        Computes the SHA-256 digest of a file's full content.
+
+        The file is read in 1 MiB blocks so memory use does not depend on the file size.
+
+        :param file_path: A string containing the path to the file.
+        :return: A string containing the hexadecimal SHA-256 digest.
+
+    """
+    def file_sha256(self, file_path):
+        sha = hashlib.sha256()
+        with open(file_path, 'rb') as f:
+            for block in iter(lambda: f.read(1 << 20), b''):
+                sha.update(block)
+        return sha.hexdigest()
+
+
+    """
+        Checks whether a file with the given content hash has already been loaded.
+
+        On first use, this method creates the audit table if it does not exist. The audit table records the name, 
+        SHA-256 digest, row count, and load time of every loaded file.
+
+        :param file_hash: A string containing the SHA-256 digest of the file.
+        :return: A boolean indicating whether the content was already loaded.
+
+    """
+    def already_loaded(self, file_hash):
+
+        # Establish a connection to the database and create a cursor
+        conn = self.connect_to_database()
+        cursor = conn.cursor()
+
+        try:
+            # Create the audit table once per process if it does not exist
+            if not self.audit_table_ready:
+                cursor.execute(f"IF OBJECT_ID(N'{self.audit_table}', N'U') IS NULL "
+                               f"CREATE TABLE {self.audit_table} (sha256 CHAR(64) PRIMARY KEY, file_name NVARCHAR(260), "
+                               f"row_count BIGINT NULL, loaded_at DATETIME2 DEFAULT SYSUTCDATETIME())")
+                conn.commit()
+                self.audit_table_ready = True
+
+            # Look up the content hash in the audit table
+            cursor.execute(f"SELECT 1 FROM {self.audit_table} WHERE sha256 = ?", file_hash)
+            return cursor.fetchone() is not None
+
+        finally:
+            # Close the cursor and the connection
+            cursor.close()
+            conn.close()
+
+
+    """
+        Records a loaded file in the audit table.
+
+        :param file_name: A string containing the name of the loaded file.
+        :param file_hash: A string containing the SHA-256 digest of the file.
+        :param row_count: An integer containing the number of rows loaded, or None if the import method does not report it.
+
+    """
+    def record_load(self, file_name, file_hash, row_count):
+
+        # Establish a connection to the database and create a cursor
+        conn = self.connect_to_database()
+        cursor = conn.cursor()
+
+        try:
+            # Insert the audit record and commit it
+            cursor.execute(f"INSERT INTO {self.audit_table} (sha256, file_name, row_count) VALUES (?, ?, ?)", file_hash, file_name, row_count)
+            conn.commit()
+
+        finally:
+            # Close the cursor and the connection
+            cursor.close()
+            conn.close()
+
+
     """
         Processes a file based on its type and moves it to an archive folder after processing.
 
@@ -648,23 +1808,23 @@ class ETLProcess:
         It supports CSV, TXT, and JSON file types. If the file is a ZIP file, it extracts the contents 
         before processing. After processing a file, it moves the file to an archive folder.
 
+        Files are loaded concurrently by up to `parallel_files` worker threads, since each load spends its time on 
+        disk and database I/O. When the table is recreated, the first file is loaded on its own before the others.
+        If `disable_indexes_on_load` is set, the nonclustered indexes are disabled once before the first file and 
+        rebuilt once after the last, rather than around each file while other files are still loading.
+
         If an error occurs while processing a file, it logs an error message and continues with the next file.
         If an error occurs while moving a file to the archive folder, it logs an error message.
 
         :param file_path: A string containing the path to the file to be processed.
         :param archive_path: A string containing the path to the archive folder where processed files should be moved.
         :param tableName: A string containing the name of the database table where the data should be imported.
+        :return: The fingerprint of the files that were loaded, from `input_fingerprint`, if every file was loaded and 
+                 archived without error, or None otherwise.
     
     """
     def process_file(self, file_path, archive_path,tableName):
 
-        # Define a dictionary mapping file types to their respective handler functions
-        file_type_handlers = {
-            'txt': self.handle_csv,
-            'csv': self.handle_csv,
-            'json': self.handle_json,
-        }
-
         try:
 
             # Print the name of the file being processed, and if it's a zip file, print a message and extract its contents
@@ -674,63 +1834,125 @@ class ETLProcess:
                 self.extract_file_if_compressed(file_path)
             
             # Get the directory path of the file and print a message indicating the directory being processed
-            directory_path = os.path.dirname(file_path)
+            directory_path = self.input_directory(file_path)
             print(f"Processing files in directory: {directory_path}")
 
-            # Iterate over all files in the directory and its subdirectories
-            for root, dirs, files in os.walk(directory_path):
-                for file in files:
-                     # For each file, print a message indicating the file being processed
-                    print(f"Processing file: {file}")
-
-                    # If the file ends with the expected suffix and file type, print a message indicating a valid file was found
-                    if file.endswith(self.file_suffix + '.' + self.file_type):
-                        csv_file_path = os.path.join(root, file)   
-                        print(f"Valid file found: {csv_file_path}")                   
-                        
-                        try:
-                            # Process each file using the appropriate handler function for its file type
-                            handler = file_type_handlers[self.file_type]
-                            print(f"Processing {self.file_type} file: {csv_file_path}")
-                            handler(csv_file_path,tableName)  
+            # Make sure the archive folder exists before any file is moved into it
+            os.makedirs(archive_path, exist_ok=True)
 
-                            # Set drop_table_if_exists to False after processing a file
-                            self.drop_table_if_exists = False
+            # Look up the handler for the file type once, rather than for every file
+            handler = self.file_type_handlers[self.file_type]
 
-                            logging.info(f"Processed {self.file_type} file: {csv_file_path}")
-                        except Exception as e:
-                            # Log any exceptions that occur during file processing and continue with the next file
-                            logging.error(f"Error processing file {csv_file_path}: {str(e)}")
-                            continue  # Continue with the next file
+            # Collect the files in the directory and its subdirectories that end with the expected suffix and file type
+            file_paths = self.find_input_files(file_path)
+            logging.info(f"Processing {len(file_paths)} files from {directory_path}")
+            for csv_file_path in file_paths:
+                logging.debug("Valid file found: %s", csv_file_path)
 
-                        # If the file was processed successfully, try to move it to the archive folder
-                        try:
-                            shutil.move(csv_file_path, os.path.join(archive_path, file))
-                            logging.info(f"Moved {file} to the archive folder.")
+            # Fingerprint the files before any of them is loaded and archived, so the saved state describes exactly this input
+            fingerprint = self.input_fingerprint(file_path, file_paths)
 
-                            # Set drop_table_if_exists to False after moving a file
-                            self.drop_table_if_exists = False
+            succeeded = True
 
-                        except Exception as e:
-                            # Log any exceptions that occur during file moving
-                            logging.error(f"Error moving file {csv_file_path} to archive: {str(e)}")
-                    else:
-                         # If the file does not end with the expected suffix and file type, print a message indicating an invalid file was found
-                        print(f"Invalid file found: {file}")
-                        print(f"Expected file suffix: {self.file_suffix + '.' + self.file_type}")
+            # If configured, disable the nonclustered indexes once for all the files, so the loads do not maintain them row by row.
+            # A table that is about to be recreated has no nonclustered indexes to disable
+            disabled_indexes = []
+            if self.disable_indexes_on_load and file_paths and not self.drop_table_if_exists:
+                disabled_indexes = self.disable_indexes(tableName)
+
+            try:
+                # If the table is to be recreated, or the audit table may still need creating, process the first file on its own
+                # so the tables exist before the remaining files are loaded into them concurrently
+                if file_paths and (self.drop_table_if_exists or (self.audit_table and not self.audit_table_ready)):
+                    succeeded = self._process_one(file_paths.pop(0), archive_path, tableName, handler)
+
+                # Process the remaining files concurrently; each load waits on disk and the database rather than the CPU
+                with ThreadPoolExecutor(max_workers=self.parallel_files) as executor:
+                    futures = [executor.submit(self._process_one, csv_file_path, archive_path, tableName, handler) for csv_file_path in file_paths]
+                    for future in as_completed(futures):
+                        succeeded = future.result() and succeeded
+            finally:
+                # Rebuild the disabled indexes once every file has finished loading
+                if disabled_indexes:
+                    self.rebuild_indexes(tableName)
+
+            return fingerprint if succeeded else None
 
         # Log any exceptions that occur during the execution of the process_file method
         except Exception as e:
             logging.error(f"Error in process_file method: {str(e)}")
+            return None
+        finally:
+            # Close the connections reused across the files
+            self.close_connections()
+
+    """
+        Processes a single valid file found by process_file and moves it to the archive folder.
+
+        The file is loaded with the handler for the configured file type, unless load auditing is enabled and its 
+        content was already loaded. The handlers raise when a load fails, so the load is only recorded in the audit 
+        table and the file only archived once the handler has returned after committing its data. Errors are logged 
+        rather than raised, so one failed file does not stop the others.
+
+        :param csv_file_path: A string containing the path to the file to be processed.
+        :param archive_path: A string containing the path to the archive folder where processed files should be moved.
+        :param tableName: A string containing the name of the database table where the data should be imported.
+        :param handler: The method that loads a file of the configured file type, from file_type_handlers.
+        :return: A boolean indicating whether the file was loaded, or skipped as already loaded, and then archived.
+
+    """
+    def _process_one(self, csv_file_path, archive_path, tableName, handler):
+
+        file = os.path.basename(csv_file_path)
+
+        try:
+            # If load auditing is enabled, hash the file and skip it if the same content was already loaded
+            file_hash = self.file_sha256(csv_file_path) if self.audit_table else None
+            if file_hash and self.already_loaded(file_hash):
+                logging.info(f"Skipping {csv_file_path}: its content was already loaded.")
+            else:
+                # Process each file using the appropriate handler function for its file type; it raises if the load fails
+                print(f"Processing {self.file_type} file: {csv_file_path}")
+                row_count = handler(csv_file_path,tableName)  
+
+                # The load has been committed, so record it before archiving, so a rerun after a failed move does not load the file again
+                if file_hash:
+                    self.record_load(file, file_hash, row_count)
+
+                # Set drop_table_if_exists to False after processing a file
+                self.drop_table_if_exists = False
+
+                logging.info(f"Processed {self.file_type} file: {csv_file_path}")
+        except Exception as e:
+            # Log any exceptions that occur during file processing and continue with the next file
+            logging.error(f"Error processing file {csv_file_path}: {str(e)}")
+            return False
+
+        # If the file was processed successfully, try to move it to the archive folder
+        try:
+            self.move_to_archive(csv_file_path, archive_path)
+            logging.info(f"Moved {file} to the archive folder.")
+
+            # Set drop_table_if_exists to False after moving a file
+            self.drop_table_if_exists = False
+
+        except Exception as e:
+            # Log any exceptions that occur during file moving
+            logging.error(f"Error moving file {csv_file_path} to archive: {str(e)}")
+            return False
+
+        return True
 
     """
         Processes a CSV file and imports its data into a database table.
 
         This method reads the first row of the CSV file to get the column names, formats the column names for SQL, 
         and creates or updates the database table. It then imports the data from the CSV file into the database table 
-        using either the BCP utility or pandas, depending on the ETL configuration.
+        using either the BCP utility or pandas, depending on the ETL configuration. `use_bulk_copy` is an alias of 
+        `bcp_import`, so either setting loads the file with the BCP utility.
 
-        If an error occurs while processing the CSV file or importing the data, it logs an error message.
+        If an error occurs while processing the CSV file or importing the data, or no import method is selected, it 
+        logs an error message and raises the exception, so the caller does not record or archive a file that was not loaded.
 
         :param file_path: A string containing the path to the CSV file to be processed.
         :param tableName: A string containing the name of the database table where the data should be imported.
@@ -741,41 +1963,130 @@ class ETLProcess:
         # Print a message indicating the CSV file being processed
         print(f"Processing CSV file: {file_path}")
 
+        # Number of rows imported, when the import method reports it
+        row_count = None
+
         try:
             # Assign the field delimiter from the ETL configuration to a local variable
             delimiter = self.field_delimiter
+
+            # When the Arrow import method will load the file, open its reader now so the header and the data come from a single parse
+            arrow_reader = None
+            if self.arrow_import_bool and pacsv is not None and not (self.use_bulk_copy or self.bcp_import_bool or self.bulkcopy_import_bool):
+                arrow_reader = self.open_arrow_csv(file_path)
            
             # If the CSV file has a header, read the column names from the first row
             if self.file_has_header :
-                with open(file_path, 'r') as csvfile:
-                    reader = csv.reader(csvfile, delimiter=delimiter, quoting=csv.QUOTE_MINIMAL)
-                     
-                    # Format column names for SQL
-                    columns = next(reader)
-                    columns_sql = ['[' + column + '] varchar(max)' for column in columns]  # Format column names
+                if arrow_reader is not None:
+                    columns = arrow_reader.schema.names
+                else:
+                    with open(file_path, 'r') as csvfile:
+                        reader = csv.reader(csvfile, delimiter=delimiter, quoting=csv.QUOTE_MINIMAL)
+                        columns = next(reader)
+
+                # Format column names for SQL
+                columns_sql = ['[' + column + '] varchar(max)' for column in columns]  # Format column names
 
                 # Create or update table in the database
                 self.create_table_and_view(columns_sql,tableName)
 
             # Print a message indicating the start of the data import process
             print(f"Importing data from {file_path} to {tableName}")
+
             try:
-                # If BCP import is enabled, use it to import the data
-                if self.bcp_import_bool:
-                    self.bcp_import(file_path, tableName)
+                # If BCP import is enabled, or use_bulk_copy as its alias, use it to import the data
+                if self.bcp_import_bool or self.use_bulk_copy:
+                    row_count = self.bcp_import(file_path, tableName)
+                # If TDS bulk copy import is enabled, use it to import the data
+                elif self.bulkcopy_import_bool:
+                    row_count = self.bulkcopy_import(file_path, tableName)
+                # If Arrow import is enabled, use it to import the data
+                elif self.arrow_import_bool:
+                    row_count = self.arrow_import(file_path, tableName, reader=arrow_reader)
                 # If pandas import is enabled, use it to import the data  
                 elif self.pandas_import_bool:
-                    self.pandas_import(file_path, tableName)
-                # If no import method is selected, print a message 
+                    row_count = self.pandas_import(file_path, tableName)
+                # If no import method is selected, nothing is loaded
                 else:
                     print("No import method selected")
+                    raise ValueError("No import method selected")
             except Exception as e:
                 # Log any exceptions that occur during data import
                 logging.error(f"Error importing data from {file_path} to {tableName}: {str(e)}")    
+                raise
             
         except Exception as e:
             # Log any exceptions that occur during the processing of the CSV file
             logging.error(f"Error processing CSV file {file_path}: {str(e)}")   
+            raise
+
+        return row_count
+
+
+    """
+        Disables the nonclustered indexes of a database table before a bulk load.
+
+        Only nonclustered indexes are disabled; disabling the clustered index would make the table inaccessible. 
+        process_file calls it once before loading a batch of files, and `rebuild_indexes` once they have all loaded.
+
+        :param tableName: A string containing the name of the database table.
+        :return: A list containing the names of the indexes that were disabled.
+
+    """
+    def disable_indexes(self, tableName):
+
+        # Establish a connection to the database and create a cursor
+        conn = self.connect_to_database()
+        cursor = conn.cursor()
+
+        try:
+            # Find the enabled nonclustered indexes of the table
+            cursor.execute(f"SELECT name FROM sys.indexes WHERE object_id = OBJECT_ID(N'{tableName}') AND type_desc = 'NONCLUSTERED' AND is_disabled = 0")
+            indexes = [row[0] for row in cursor.fetchall()]
+
+            # Disable each index and commit once
+            for index in indexes:
+                cursor.execute(f"ALTER INDEX [{index}] ON {tableName} DISABLE")
+            conn.commit()
+
+            if indexes:
+                logging.info(f"Disabled {len(indexes)} nonclustered indexes on {tableName}.")
+            return indexes
+
+        finally:
+            # Close the cursor and the connection
+            cursor.close()
+            conn.close()
+
+
+    """
+        Rebuilds all indexes of a database table after a bulk load.
+
+        Rebuilding re-enables the nonclustered indexes disabled by `disable_indexes` in a single sorted pass.
+
+        :param tableName: A string containing the name of the database table.
+
+    """
+    def rebuild_indexes(self, tableName):
+
+        # Establish a connection to the database and create a cursor
+        conn = self.connect_to_database()
+        cursor = conn.cursor()
+
+        try:
+            # Rebuild every index on the table offline, which also re-enables disabled indexes
+            cursor.execute(f"ALTER INDEX ALL ON {tableName} REBUILD WITH (ONLINE = OFF)")
+            conn.commit()
+            logging.info(f"Rebuilt indexes on {tableName}.")
+
+        except pyodbc.Error as e:
+            # Log any errors that occur during the rebuild
+            logging.error(f"Error rebuilding indexes on {tableName}: {e}")
+
+        finally:
+            # Close the cursor and the connection
+            cursor.close()
+            conn.close()
 
 
     """
@@ -783,54 +2094,51 @@ class ETLProcess:
 
         This method connects to the database and creates a table with the specified columns. If the table already exists 
         and the drop_table_if_exists flag is True, it drops the table before creating it. It then creates a view that 
-        includes all columns except the identity column.
+        includes all columns except the identity column. The view's column list is taken from `columns_sql`, and all of 
+        the statements are sent in one batch and committed once. When drop_table_if_exists is False, it does nothing.
 
         If an error occurs while creating or verifying the table or view, it logs an error message and rolls back the 
-        transaction. After the operation, it closes the cursor and the database connection.
+        transaction. After the operation, it closes the cursor; the connection is left open for reuse.
 
         :param columns_sql: A string or list containing the column definitions for the table.
         :param tableName: A string containing the name of the database table to be created or verified.
+        :param conn: An optional database connection to use. Defaults to the calling thread's reused connection.
     
     """
-    def create_table_and_view(self, columns_sql,tableName):      
+    def create_table_and_view(self, columns_sql,tableName, conn=None):      
+        # Use the given connection, or the calling thread's reused connection, and create a cursor
+        conn = conn or self._get_conn()
+        cursor = conn.cursor()
+
         try:
-            # Establish a connection to the database and create a cursor
-            conn = self.connect_to_database()
-            cursor = conn.cursor()            
 
             # Convert columns_sql to a list if it's a string
             if isinstance(columns_sql, str):
                 columns_sql = columns_sql.split(', ')
 
-            # If drop_table_if_exists is True, drop the table if it exists
-            if self.drop_table_if_exists:
-                drop_table_query = f"IF EXISTS (SELECT * FROM sys.tables WHERE name = N'{tableName}' AND type = 'U') DROP TABLE {tableName}"
-                cursor.execute(drop_table_query)
-                conn.commit()
-                
-                # Create a new table with the specified columns
-                create_table_query = f"CREATE TABLE {tableName} (RecId INT PRIMARY KEY IDENTITY(1,1), {', '.join(columns_sql)})"  
+            # The table and view are only recreated when drop_table_if_exists is True
+            if not self.drop_table_if_exists:
+                return
 
-                # Execute the create table query
-                cursor.execute(create_table_query)
-                conn.commit()
-                logging.info(f"Table {tableName} created or verified successfully.")
+            # Forget the cached view columns, since the table and view are about to be recreated
+            self._col_cache.pop((self.dbServer, self.dbName, tableName), None)
 
-                # Query the database for the column names of the table
-                cursor.execute(f"SELECT COLUMN_NAME FROM INFORMATION_SCHEMA.COLUMNS WHERE TABLE_NAME = N'{tableName}' ORDER BY ORDINAL_POSITION")
-                columns_sql = [row[0] for row in cursor.fetchall()]
+            # Drop the table if it exists and create a new table with the specified columns
+            drop_table_query = f"IF EXISTS (SELECT * FROM sys.tables WHERE name = N'{tableName}' AND type = 'U') DROP TABLE {tableName}"
+            create_table_query = f"CREATE TABLE {tableName} (RecId INT PRIMARY KEY IDENTITY(1,1), {', '.join(columns_sql)})"  
 
-                # Drop the view if it exists
-                drop_view_query = f"IF EXISTS (SELECT * FROM sys.views WHERE name = N'{tableName}_View') DROP VIEW {tableName}_View"
-                cursor.execute(drop_view_query)
-                conn.commit()
+            # Drop the view if it exists and create a view that includes all columns except the identity column, taking the
+            # column names from between the brackets of the column definitions
+            columns_without_id = [f"[{column.split(']', 1)[0].split('[', 1)[1]}]" for column in columns_sql]
+            drop_view_query = f"IF EXISTS (SELECT * FROM sys.views WHERE name = N'{tableName}_View') DROP VIEW {tableName}_View"
+            create_view_query = f"CREATE VIEW {tableName}_View AS SELECT {', '.join(columns_without_id)} FROM {tableName}"
 
-                # Create a view that includes all columns except the identity column
-                columns_without_id = [f"[{column}]" for column in columns_sql[1:]]  # Exclude the first column, which is the identity column
-                create_view_query = f"CREATE VIEW {tableName}_View AS SELECT {', '.join(columns_without_id)} FROM {tableName}"
-                cursor.execute(create_view_query)
-                conn.commit()
-                logging.info(f"View {tableName}_View created successfully.")
+            # Send the statements as one batch and commit once. CREATE VIEW must start its own batch, so it runs through EXEC
+            create_view_exec = "EXEC(N'" + create_view_query.replace("'", "''") + "')"
+            cursor.execute(';\n'.join([drop_table_query, create_table_query, drop_view_query, create_view_exec]))
+            conn.commit()
+            logging.info(f"Table {tableName} created or verified successfully.")
+            logging.info(f"View {tableName}_View created successfully.")
 
         except Exception as e:
             # Log any exceptions that occur during table or view creation
@@ -838,9 +2146,8 @@ class ETLProcess:
             conn.rollback()  # Roll back the transaction
 
         finally:
-            # Close the cursor and the connection
+            # Close the cursor, leaving the connection open for reuse
             cursor.close()
-            conn.close()
 
     """
         Processes a JSON file and imports its data into a database table.
@@ -849,47 +2156,77 @@ class ETLProcess:
         from the first item in the data, assumes all columns are of type NVARCHAR(MAX), and creates or verifies 
         the database table. It then inserts the JSON data into the database table.
 
-        If an error occurs while processing the JSON file or importing the data, it logs an error message and rolls 
-        back the transaction. After the operation, it closes the cursor and the database connection.
+        When ijson is installed, the top-level array is parsed incrementally and records are inserted as they are 
+        read, so memory use is bounded by the batch size rather than the file size.
+
+        If an error occurs while processing the JSON file or importing the data, it logs an error message, rolls 
+        back the transaction and raises the exception. After the operation, it closes the cursor; the connection is reused for the next file.
 
         :param file_path: A string containing the path to the JSON file to be processed.
         :param tableName: A string containing the name of the database table where the data should be imported.
     
     """
     def handle_json(self, file_path,tableName):
-        try:
-            # Establish a connection to the database and create a cursor
-            conn = self.connect_to_database()
-            cursor = conn.cursor()        
 
-            # Open the JSON file and load the data into a Python object
-            with open(file_path, 'r') as f:
-                data = json.load(f)
+        # Use the calling thread's reused connection and create a cursor that sends parameter arrays in one round trip
+        conn = self._get_conn()
+        cursor = conn.cursor()        
+        cursor.fast_executemany = True
 
-            # Get the column names from the first item in the data
-            columns = data[0].keys()
-
-            # Assume all columns are of type NVARCHAR(MAX) for the SQL table
-            columns_sql = ', '.join(f"[{column}] NVARCHAR(MAX)" for column in columns)
-
-            # Create or update the table and view in the database
-            self.create_table_and_view(columns_sql, tableName)
+        try:
 
-            # Iterate over each item in the data
-            for item in data:
-                # Get the column names and values from the item
-                columns = ', '.join(item.keys())
-                values = ', '.join(f"'{value}'" for value in item.values())
+            # Open the JSON file and parse its records, incrementally when ijson is available so the whole array is never held in memory
+            with open(file_path, 'rb') as f:
+                records = ijson.items(f, 'item', use_float=True) if ijson else iter(_json_loads(f.read()))
+
+                # Get the column names from the first record, then put it back in front of the remaining records
+                first = next(records)
+                columns = list(first.keys())
+                records = itertools.chain([first], records)
+
+                # Assume all columns are of type NVARCHAR(MAX) for the SQL table
+                columns_sql = ', '.join(f"[{column}] NVARCHAR(MAX)" for column in columns)
+
+                # Create or update the table and view in the database
+                self.create_table_and_view(columns_sql, tableName, conn)
+
+                # Pick the column values out of each record in C with itemgetter, wrapping a single column in a tuple since
+                # itemgetter returns a bare value for one key
+                getter = operator.itemgetter(*columns)
+                if len(columns) == 1:
+                    getter = lambda item, get=getter: (get(item),)
+
+                # Build a row of parameters for each record, serializing nested objects and arrays to JSON text, and insert
+                # the rows with parameterized executemany calls each time a batch of the configured batch size fills up
+                num_rows = 0
+                batch = []
+                nested = (dict, list)
+                batch_size = self.batch_size
+                for item in records:
+                    try:
+                        row = getter(item)
+                    except KeyError:
+                        # Records missing some of the columns get NULL for them
+                        row = tuple(map(item.get, columns))
+                    if any(isinstance(value, nested) for value in row):
+                        row = tuple(_json_dumps(value) if isinstance(value, nested) else value for value in row)
+                    batch.append(row)
+                    if len(batch) >= batch_size:
+                        self.insert_rows(cursor, tableName, columns, batch)
+                        num_rows += len(batch)
+                        batch.clear()
+
+                # Insert the remaining rows
+                if batch:
+                    self.insert_rows(cursor, tableName, columns, batch)
+                    num_rows += len(batch)
 
-                # Construct an SQL insert query and execute it
-                insert_query = f"INSERT INTO {tableName} ({columns}) VALUES ({values})"
-                cursor.execute(insert_query)
-            
             # Commit the transaction
             conn.commit()
 
             # Log a message indicating the successful insertion of the JSON data
             logging.info(f"JSON data from {file_path} inserted successfully.")
+            return num_rows
 
         except Exception as e:
             # Log any exceptions that occur during the processing of the JSON file
@@ -897,10 +2234,10 @@ class ETLProcess:
 
             # Roll back the transaction in case of error
             conn.rollback()
+            raise
         finally:
-            # Close the cursor and the connection
+            # Close the cursor, leaving the connection open for reuse
             cursor.close()
-            conn.close()
  
     """
         Processes data from URLs specified in the ETL configuration and imports the data into database tables.
@@ -908,7 +2245,8 @@ class ETLProcess:
         This method reads the download path, archive path, and file header flag from the ETL configuration. It also 
         reads the URL links, column names, and table names from the URL_SOURCE section of the configuration.
 
-        For each URL, it downloads the data, checks if the file has a header, and if not, creates a table with the 
+        The files are first downloaded concurrently, each into its own numbered subfolder of the download path. Then, 
+        for each downloaded file in turn, it checks if the file has a header, and if not, creates a table with the 
         specified columns. It then processes the downloaded file and moves it to the archive folder.
 
         If an error occurs while processing a URL, it logs an error message and continues with the next URL. If a 
@@ -920,31 +2258,56 @@ class ETLProcess:
     def process_url(self):  
         try:
             # Get the download path, archive path, and file_has_header flag from the config file          
-            downloadPath = self.config['ETL']['download_path']   
-            archivePath = self.config['ETL']['archive_path']  
-            file_has_header = self.config['ETL'].getboolean('file_has_header')                  
+            downloadPath = self.cfg.download_path
+            archivePath = self.cfg.archive_path
+            file_has_header = self.cfg.file_has_header
 
             # Get the URL links, column names, and table names from the config file
             url_links = self.config['URL_SOURCE']['url_links'].splitlines()
             url_column_names = self.config['URL_SOURCE']['url_column_names'].splitlines()
             url_table_names = self.config['URL_SOURCE']['url_table_names'].splitlines()
 
-            # Process each URL
-            for url, column_names, table_name in zip(url_links, url_column_names, url_table_names):
-                if not url.strip():  # Skip empty URLs
-                    continue
+            # Warn when the lists differ in length, since the URLs without a column list or table name are ignored
+            if not len(url_links) == len(url_column_names) == len(url_table_names):
+                logging.warning(f"URL_SOURCE has {len(url_links)} url_links, {len(url_column_names)} url_column_names and "
+                                f"{len(url_table_names)} url_table_names; unmatched entries are ignored.")
+
+            # Skip empty URLs
+            sources = [(url, column_names, table_name) for url, column_names, table_name in zip(url_links, url_column_names, url_table_names) if url.strip()]
+
+            # Build each URL's column definitions up front, assuming all columns are of type NVARCHAR(MAX). They are not
+            # needed when the files have a header, since the CSV handler builds them from it
+            columns_sql_list = [None] * len(sources) if file_has_header else [
+                ', '.join(f"[{column}] NVARCHAR(MAX)" for column in column_names.split(',') if column.strip())
+                for _, column_names, _ in sources]
+
+            # Empty the folder of zip and csv files, then give each URL its own subfolder so concurrent downloads and
+            # the processing of each file do not see one another's files
+            self.empty_folder_of_zip_csv(downloadPath)
+            file_paths = []
+            for index, (url, _, _) in enumerate(sources):
+                url_folder = os.path.join(downloadPath, str(index))
+                os.makedirs(url_folder, exist_ok=True)
+                file_paths.append(os.path.join(url_folder, f'{url.split("/")[-1]}'))
+
+            # Define a function that downloads one file, logging failures so the other downloads carry on
+            def download(url, file_path):
                 try:
-                    # Empty the folder of zip and csv files
-                    self.empty_folder_of_zip_csv(downloadPath)
-
-                    # Construct the file path and download the file from the URL               
-                    file_path = os.path.join(downloadPath, f'{url.split("/")[-1]}')
                     self.download_from_url(url, file_path)
+                except Exception as e:
+                    logging.error(f"Error downloading {url}: {str(e)}")
 
+            # Download the files concurrently, since the downloads are network-bound and independent
+            with ThreadPoolExecutor(max_workers=8) as executor:
+                list(executor.map(download, [url for url, _, _ in sources], file_paths))
+
+            # Process each downloaded file in turn, as the database steps share tables and connections
+            for (url, _, table_name), file_path, columns_sql in zip(sources, file_paths, columns_sql_list):
+                if not os.path.exists(file_path):
+                    logging.error(f"Skipping {url}: the file was not downloaded.")
+                    continue
+                try:
                     if not file_has_header:
-                        # Assume all columns are of type NVARCHAR(MAX)
-                        columns_sql = ', '.join(f"[{column}] NVARCHAR(MAX)" for column in column_names.split(',') if column.strip())    
-                        
                         # Create the table and view in the database
                         self.create_table_and_view(columns_sql,table_name)
                     
@@ -952,9 +2315,9 @@ class ETLProcess:
                     print(f"Processing file: {file_path}")
                     self.process_file(file_path, archivePath,table_name)
 
-                except requests.exceptions.MissingSchema:
-                    # Log an error message if the URL is invalid
-                    logging.error(f"Invalid URL: {url}")
+                except Exception as e:
+                    # Log an error message and continue with the next URL
+                    logging.error(f"Error processing {url}: {str(e)}")
                     continue
 
         except Exception as e:
@@ -10,58 +10,70 @@ Description:
 # 1. Initializes the ETL process with a configuration file specific to S3 sources.
 # 2. Empties the specified download folder of any existing zip and csv files to prepare for new downloads.
 # 3. Downloads data from a specified S3 bucket and folder to the local download path.
-# 4. Iterates over each file in the download path, processing each file by:
-#    a. Extracting and transforming the data as needed.
-#    b. Loading the transformed data into a specified MSSQL database table.
-#    c. Archiving the processed file to a specified archive path.
-#    d. Emptying the download folder again to prepare for the next file's processing.
-# 5. Calculates the total execution time of the ETL process.
-# 6. Sends an email notification upon successful completion or failure of the ETL process.
-# 7. Logs the outcome of the ETL process.
+# 4. Extracts any downloaded zip files into the download path.
+# 5. Processes the download path once, which for every matching file:
+#    a. Transforms the data as needed.
+#    b. Loads the transformed data into a specified MSSQL database table.
+#    c. Archives the processed file to a specified archive path.
+# 6. Empties the download folder once all files have been processed.
+# 7. Calculates the total execution time of the ETL process.
+# 8. Sends an email notification upon successful completion, or failure if any file failed to load.
+# 9. Logs the outcome of the ETL process.
 
 """
 
 from etlModule import EmailUtility
 from etlModule import ETLProcess
+from etlModule import configure_queue_logging
 
-from datetime import datetime
+import time
 import logging
 import os
 
 
-logging.basicConfig(level=logging.INFO)
+configure_queue_logging(logging.INFO)
 
 def main():
 
-    start_time = datetime.now()
+    start_time = time.perf_counter()
     # Initialize the ETLProcess with a configuration file for S3 sources. Replace 'e:\ETLsolutions\config_s3.ini' with the path to your local configuration file.
     etl = ETLProcess('e:\ETLsolutions\config_s3.ini')  
 
+    cfg = etl.cfg
+
     try:          
-        downloadPath = etl.config['ETL']['download_path']   
+        downloadPath = cfg.download_path   
         etl.empty_folder_of_zip_csv(downloadPath)
 
-        filename = etl.config['ETL']['file_name']   
-        archivePath = etl.config['ETL']['archive_path']
-        tableName = etl.config['MSSQL']['table_name']          
-        targetFile=os.path.join(downloadPath,filename)  
+        archivePath = cfg.archive_path
+        tableName = cfg.table_name          
 
         etl.download_from_s3(etl.config['S3_SOURCE']['s3_bucket'], etl.config['S3_SOURCE']['s3_folder'], downloadPath)
-        files = os.listdir(downloadPath)
 
-        for filename in files:
-            targetFile = os.path.join(downloadPath, filename)
-            etl.process_file(targetFile, archivePath, tableName)
-            etl.empty_folder_of_zip_csv(downloadPath)
+        # Extract the downloaded zip files first, so their contents are loaded with the other files
+        for filename in os.listdir(downloadPath):
+            if filename.endswith('.zip'):
+                etl.extract_file_if_compressed(os.path.join(downloadPath, filename))
+
+        # Process the whole download folder once, so each file is loaded exactly once
+        succeeded = etl.process_file(downloadPath, archivePath, tableName)
+
+        # Empty the folder once, clearing any extracted contents left behind
+        etl.empty_folder_of_zip_csv(downloadPath)
+
+        # Report a failed file as a failure rather than a success; process_file has already logged the details
+        if not succeeded:
+            raise RuntimeError(f"One or more files in {downloadPath} failed to load.")
          
-        end_time = datetime.now()
-        execution_time = (end_time - start_time).total_seconds()
-        etl.email_util.send_email("ETL Process Successful", f"The ETL process completed successfully in {execution_time} seconds.")
+        execution_time = time.perf_counter() - start_time
+        email_thread = etl.email_util.send_email_async("ETL Process Successful", f"The ETL process completed successfully in {execution_time} seconds.")
         logging.info("ETL process completed successfully.")
+        email_thread.join(timeout=60)
 
     except Exception as e:
-        logging.error(f"ETL process failed: {str(e)}")
-        etl.email_util.send_email("ETL Process Failed", f"ETL process failed with error: {str(e)}")
+        logging.error("ETL process failed: %s", e)
+        email_thread = etl.email_util.send_email_async("ETL Process Failed", f"ETL process failed with error: {str(e)}")
+        email_thread.join(timeout=60)
 
 
 if __name__ == "__main__":
@@ -26,31 +26,33 @@ Description:
 
 from etlModule import EmailUtility
 from etlModule import ETLProcess
+from etlModule import configure_queue_logging
+from etlModule import _ssm
 
-from datetime import datetime
+import time
 import logging
 import os
-import boto3
 
 
-logging.basicConfig(level=logging.INFO)
+configure_queue_logging(logging.INFO)
 
 def main():
 
-    start_time = datetime.now()
+    start_time = time.perf_counter()
     # Initialize the ETLProcess with a configuration file for SFTP sources. Replace 'e:\ETLsolutions\config_sftp.ini' with the path to your local configuration file.
     etl = ETLProcess('e:\ETLsolutions\config_sftp.ini')
-    # Initialize the AWS SSM client with your AWS region. Replace 'us-west-2' with your AWS region.  
-    ssm = boto3.client('ssm', region_name='us-west-2')  
-    sftp_password = ssm.get_parameter(Name='sftp_password', WithDecryption=True)['Parameter']['Value']       
+    # Retrieve the SFTP password with the shared AWS SSM client. Replace 'us-west-2' in etlModule._ssm with your AWS region.
+    sftp_password = _ssm().get_parameter(Name='sftp_password', WithDecryption=True)['Parameter']['Value']       
+
+    cfg = etl.cfg
 
     try:          
-        downloadPath = etl.config['ETL']['download_path']   
+        downloadPath = cfg.download_path   
         etl.empty_folder_of_zip_csv(downloadPath)
 
-        filename =etl.config['ETL']['file_name']   
-        archivePath =etl.config['ETL']['archive_path'] 
-        tableName = etl.config['MSSQL']['table_name']         
+        filename = cfg.file_name   
+        archivePath = cfg.archive_path 
+        tableName = cfg.table_name         
         targetFile=os.path.join(downloadPath,filename)  
 
         etl.download_from_sftp(etl.config['SFTP_SOURCE']['host'], etl.config['SFTP_SOURCE']['port'],
@@ -59,14 +61,15 @@ def main():
  
         etl.process_file(targetFile,archivePath,tableName)
          
-        end_time = datetime.now()
-        execution_time = (end_time - start_time).total_seconds()
-        etl.email_util.send_email("ETL Process Successful", f"The ETL process completed successfully in {execution_time} seconds.")
+        execution_time = time.perf_counter() - start_time
+        email_thread = etl.email_util.send_email_async("ETL Process Successful", f"The ETL process completed successfully in {execution_time} seconds.")
         logging.info("ETL process completed successfully.")
+        email_thread.join(timeout=60)
 
     except Exception as e:
-        logging.error(f"ETL process failed: {str(e)}")
-        etl.email_util.send_email("ETL Process Failed", f"ETL process failed with error: {str(e)}")
+        logging.error("ETL process failed: %s", e)
+        email_thread = etl.email_util.send_email_async("ETL Process Failed", f"ETL process failed with error: {str(e)}")
+        email_thread.join(timeout=60)
 
 
 if __name__ == "__main__":
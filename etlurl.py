@@ -13,30 +13,32 @@ Description:
 
 from etlModule import EmailUtility
 from etlModule import ETLProcess
+from etlModule import configure_queue_logging
 
-from datetime import datetime
+import time
 import logging
 import os
 import requests
 
-logging.basicConfig(level=logging.INFO)
+configure_queue_logging(logging.INFO)
 
 def main():
 
-    start_time = datetime.now()
+    start_time = time.perf_counter()
     # Initialize the ETLProcess with a configuration file. Replace 'e:\ETLsolutions\config_url.ini' with your local path to the config file.
     etl = ETLProcess('e:\ETLsolutions\config_url.ini')  
 
     try:          
         etl.process_url()       
-        end_time = datetime.now()
-        execution_time = (end_time - start_time).total_seconds()
-        etl.email_util.send_email("ETL Process Successful", f"The ETL process completed successfully in {execution_time} seconds.")
+        execution_time = time.perf_counter() - start_time
+        email_thread = etl.email_util.send_email_async("ETL Process Successful", f"The ETL process completed successfully in {execution_time} seconds.")
         logging.info("ETL process completed successfully.")
+        email_thread.join(timeout=60)
 
     except Exception as e:
-        logging.error(f"ETL process failed: {str(e)}")
-        etl.email_util.send_email("ETL Process Failed", f"ETL process failed with error: {str(e)}")
+        logging.error("ETL process failed: %s", e)
+        email_thread = etl.email_util.send_email_async("ETL Process Failed", f"ETL process failed with error: {str(e)}")
+        email_thread.join(timeout=60)
 
 
 if __name__ == "__main__":
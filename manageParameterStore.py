@@ -14,56 +14,192 @@
 
 
 import boto3
+import functools
 import os
 import random
+import re
 import string
+import tempfile
+import time
+from botocore.config import Config
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, TimeoutError as FutureTimeoutError, wait
 
-# Replace 'us-west-2' with your AWS region where your SSM Parameter Store is located.
-ssm = boto3.client('ssm', region_name='us-west-2')
+# The AWS region where your SSM Parameter Store is located, and the folder and name of the local parameters file.
+# Set AWS_REGION, ETL_PARAM_DIR and ETL_PARAM_FILE in the environment to override them.
+REGION = os.environ.get('AWS_REGION', 'us-west-2')
+PARAM_DIR = os.environ.get('ETL_PARAM_DIR', 'e:\\ETLsolutions\\parameterStore')
+PARAM_FILE = os.environ.get('ETL_PARAM_FILE', 'parameters.txt')
+
+"""
+    Returns the shared SSM client, creating it on first use.
+
+    boto3 clients are thread-safe, and creating one loads the service model, so it is only created when a 
+    parameter is first read or written and then shared by every call. The connection pool is large enough for 
+    the concurrent writes, connections are kept alive between calls, calls time out rather than hang, and 
+    throttled calls are retried with adaptive backoff.
+
+    :return: A boto3 SSM client.
+
+"""
+@functools.lru_cache(maxsize=1)
+def _ssm():
+    return boto3.client('ssm', region_name=REGION, config=Config(
+        max_pool_connections=50,
+        tcp_keepalive=True,
+        connect_timeout=3,
+        read_timeout=10,
+        retries={'max_attempts': 10, 'mode': 'adaptive'}
+    ))
+
+# Pattern of a line in the parameters file: "Name = Value (Type: Type)"
+_LINE_RE = re.compile(r'^\s*([^=]+?)\s*=\s*(.*?)\s*\(Type:\s*(\w+)\)\s*$')
+
+# Characters that generated passwords are drawn from, and the secure random source they are drawn with
+_PASSWORD_CHARACTERS = string.ascii_letters + string.digits + string.punctuation
+_SYSTEM_RANDOM = random.SystemRandom()
+
+# Whether each parameter looked up in this run exists, kept up to date as parameters are added and deleted
+_EXISTS_CACHE = {}
+
+# Threads that run the hedged read calls
+_HEDGE_EXECUTOR = ThreadPoolExecutor(max_workers=8)
+
+"""
+    Calls an SSM read function, sending a duplicate request if the first one is slow to answer.
+
+    SSM responses have a long latency tail, so if the first call has not finished after hedge_after seconds, an 
+    identical call is submitted and the first of them to succeed is used; the other is cancelled if it has not 
+    started. A call that fails does not win over one still in flight, so an error is only raised once both calls 
+    have failed. Only use it for read calls, which are safe to send twice. Throttling is retried by the client underneath.
+
+    :param fn: The function to call, such as a bound method of the SSM client.
+    :param hedge_after: A float containing the number of seconds to wait before sending the duplicate call. Defaults to 0.15.
+    :return: The result of whichever call succeeded first.
+
+"""
+def hedged_call(fn, *args, hedge_after=0.15, **kwargs):
+    first = _HEDGE_EXECUTOR.submit(fn, *args, **kwargs)
+    try:
+        return first.result(timeout=hedge_after)
+    except FutureTimeoutError:
+        pass
+
+    second = _HEDGE_EXECUTOR.submit(fn, *args, **kwargs)
+    pending = {first, second}
+    while True:
+        done, pending = wait(pending, return_when=FIRST_COMPLETED)
+        for future in done:
+            if future.exception() is None:
+                for other in pending:
+                    other.cancel()
+                return future.result()
+        # Raise the error of the last call to fail once neither call is left
+        if not pending:
+            return future.result()
 
 """
     Fetches parameters from AWS SSM Parameter Store and saves them to a file.
 
-    This method uses the AWS SDK (boto3) to paginate through the parameters in the SSM Parameter Store that 
-    begin with a specified prefix. It then fetches the values of these parameters, decrypts them if necessary, 
-    and writes them to a file in the format: "Name = Value (Type: Type)".
+    This method uses the AWS SDK (boto3) to paginate through the parameters in the SSM Parameter Store under a 
+    specified path with get_parameters_by_path, which returns the names, types and decrypted values together, 
+    so no separate call is needed to fetch the values. It writes them to a file in the format: 
+    "Name = Value (Type: Type)".
+
+    Pages can only be fetched one after another, so if sub_prefixes is given, each of those paths is fetched by its 
+    own paginator on a separate thread instead of the prefix, and their results are written to the file in order.
 
     If the directory for the file does not exist, it creates it.
 
-    :param prefix: A string containing the prefix to filter parameters by.
+    :param prefix: A string containing the path to fetch parameters from, recursively, such as '/' or '/app'.
     :param folder_path: A string containing the path to the directory where the file should be saved.
     :param file_name: A string containing the name of the file to save the parameters in.
+    :param sub_prefixes: An optional list of strings containing disjoint paths, such as ['/app/', '/db/'], to fetch 
+                         concurrently instead of the prefix. Parameters outside these paths are not fetched.
 
 """
-def fetch_and_save_parameters(prefix, folder_path, file_name):
-    paginator = ssm.get_paginator('describe_parameters')
+def fetch_and_save_parameters(prefix, folder_path, file_name, sub_prefixes=None):
+    full_path = os.path.join(folder_path, file_name)
+    os.makedirs(os.path.dirname(full_path), exist_ok=True)
+
+    # Write the encoded lines in binary mode through a 1 MiB buffer, one write per page
+    with open(full_path, 'wb', buffering=1 << 20) as file:
+        if sub_prefixes:
+            # Fetch each path on its own thread, pausing between submissions to stay under the GetParametersByPath rate quota
+            with ThreadPoolExecutor(max_workers=min(len(sub_prefixes), 8)) as executor:
+                futures = []
+                for path in sub_prefixes:
+                    futures.append(executor.submit(fetch_parameters_bytes, path))
+                    time.sleep(0.025)
+                for future in futures:
+                    file.write(future.result())
+        else:
+            # Stream the pages straight into the file, so only one page is held in memory at a time
+            for params in _iter_parameter_pages(prefix):
+                file.write(_format_parameters(params))
+
+"""
+    Yields the pages of parameters under a path in AWS SSM Parameter Store.
+
+    The pages of get_parameters_by_path are requested as they are consumed, so only one page is held in memory 
+    at a time. Each parameter is a dictionary that includes its name, decrypted value and type.
+
+    :param path: A string containing the path to fetch parameters from, recursively.
+    :return: A generator of lists of dictionaries describing the parameters.
+
+"""
+def _iter_parameter_pages(path):
+    paginator = _ssm().get_paginator('get_parameters_by_path')
     page_iterator = paginator.paginate (
-        ParameterFilters=[{
-            'Key': 'Name',
-            'Option': 'BeginsWith',
-            'Values': [prefix]
-        }]
+        Path=path,
+        Recursive=True,
+        WithDecryption=True,
+        MaxResults=10
     )
+    for page in page_iterator:
+        yield page['Parameters']
 
-    full_path = os.path.join(folder_path, file_name)
-    os.makedirs(os.path.dirname(full_path), exist_ok=True)
+"""
+    Formats parameters one per line as "Name = Value (Type: Type)", encoded as UTF-8.
+
+    :param params: A list of dictionaries describing the parameters.
+    :return: A bytearray containing the encoded lines.
 
-    with open(full_path, 'w') as file:
-        for page in page_iterator:
-            names = [param['Name'] for param in page['Parameters']]
-            if names:
-                values_response = ssm.get_parameters(Names=names, WithDecryption=True)
-                for param in values_response['Parameters']:
-                    file.write(f"{param['Name']} = {param['Value']} (Type: {param['Type']})\n")
+"""
+def _format_parameters(params):
+    buffer = bytearray()
+    for param in params:
+        buffer += f"{param['Name']} = {param['Value']} (Type: {param['Type']})\n".encode('utf-8')
+    return buffer
+
+"""
+    Fetches the parameters under a path from AWS SSM Parameter Store as encoded text.
+
+    The parameters are formatted one per line as "Name = Value (Type: Type)" into an in-memory buffer, so several 
+    paths can be fetched concurrently without sharing the output file.
+
+    :param path: A string containing the path to fetch parameters from, recursively.
+    :return: A bytearray containing the formatted parameters, encoded as UTF-8.
+
+"""
+def fetch_parameters_bytes(path):
+    buffer = bytearray()
+    for params in _iter_parameter_pages(path):
+        buffer += _format_parameters(params)
+    return buffer
 
 """
     Reads parameters from a file and processes them in the AWS SSM Parameter Store.
 
     This method opens a file and reads it line by line. Each line should contain a parameter name, value, and type 
-    in the format: "Name = Value (Type: Type)". It then processes each parameter based on its type. If the type is 
-    'DELETE', it deletes the parameter from the SSM Parameter Store. If the type is 'EDIT', it updates the parameter 
-    value in the SSM Parameter Store. If the type is neither 'DELETE' nor 'EDIT', it adds the parameter to the SSM 
-    Parameter Store.
+    in the format: "Name = Value (Type: Type)". It then looks up which of the parameters already exist, batching the 
+    names into get_parameters calls of 10, and processes each parameter based on its type. If the type is 'DELETE', 
+    it deletes the parameter from the SSM Parameter Store. If the type is 'EDIT', it updates the parameter value in 
+    the SSM Parameter Store, keeping its original type. If the type is neither 'DELETE' nor 'EDIT', it adds the 
+    parameter to the SSM Parameter Store.
+
+    Different parameters are processed concurrently on up to 16 threads, with submissions spaced to stay under the 
+    PutParameter rate quota. The lines for the same parameter are applied in file order. The file is then 
+    rewritten with the new values and types, so no fetch is needed afterwards to see the result.
 
     If an error occurs while processing a parameter, it logs an error message.
 
@@ -74,66 +210,199 @@ def fetch_and_save_parameters(prefix, folder_path, file_name):
 def process_parameters_from_file(folder_path, file_name):
     full_path = os.path.join(folder_path, file_name)
 
-    with open(full_path, 'r') as file:
-        for line in file:
-            # Skip any line that starts with '#'
-            if line.strip().startswith('#'):
-                continue
-            line = line.strip()
-            if line:
-                name_value, type_part = line.rsplit(' (Type: ', 1)
-                name, value = name_value.split('=', 1)
-                type_name = type_part.rstrip(')')
-
-                if type_name == 'DELETE':
-                    if parameter_exists(name):
-                        try:
-                            ssm.delete_parameter(Name=name)
-                            print(f"Deleted parameter: {name}")
-                        except Exception as e:
-                            print(f"Error deleting parameter {name}: {str(e)}")
-                    else:
-                        print(f"Parameter {name} does not exist. No deletion needed.")
-                
-                elif type_name == 'EDIT':
-
-                    if parameter_exists(name):
-                        try:
-                            original_parameter = ssm.get_parameter(Name=name, WithDecryption=True)['Parameter']
-                            original_type = original_parameter['Type']
-                            ssm.put_parameter (
-                                Name=name,
-                                Value=value.strip(),
-                                Type=original_type,
-                                Overwrite=True
-                            )
-                            print(f"Updated value for parameter: {name}, keeping original type: {original_type}")
-                        except Exception as e:
-                            print(f"Error updating parameter {name}: {str(e)}")
-                else:
-
-                    if not parameter_exists(name):
-                        try:
-                            ssm.put_parameter (
-                                Name=name,
-                                Value=value,
-                                Type=type_name,
-                                Overwrite=False
-                            )
-                            print(f"Added new parameter: {name} with type: {type_name}")
-                        except Exception as e:
-                            print(f"Failed to add {name}: {str(e)}")
-                    else:
-                        print(f"Parameter {name} already exists. No action performed.")
+    # Read the small file in one call, then parse all of it first, so the existence checks can be batched
+    with open(full_path, 'r', buffering=1 << 20, encoding='utf-8') as file:
+        data = file.read()
+
+    lines = data.splitlines()
+    entries = []
+    entry_names = {}
+    for index, line in enumerate(lines):
+        line = line.strip()
+        # Skip empty lines and any line that starts with '#'
+        if not line or line.startswith('#'):
+            continue
+        # Split the line into its name, value and type in one pass
+        match = _LINE_RE.match(line)
+        if not match:
+            print(f"Skipping line that is not in the 'Name = Value (Type: Type)' format: {line}")
+            continue
+        entries.append(match.groups())
+        entry_names[index] = match.group(1)
+
+    existing = get_existing_parameters([name for name, _, _ in entries])
+
+    # Group the entries by name, so the changes to one parameter are still applied in file order
+    entries_by_name = {}
+    for name, value, type_name in entries:
+        entries_by_name.setdefault(name, []).append((value, type_name))
+
+    # Apply the changes to different parameters concurrently, pausing between submissions to stay under the
+    # PutParameter rate quota; throttled calls are retried by the client
+    futures = {}
+    with ThreadPoolExecutor(max_workers=16) as executor:
+        for name, changes in entries_by_name.items():
+            futures[name] = executor.submit(apply_parameter_changes, name, changes, existing)
+            time.sleep(0.025)
+
+    # Rewrite the file from what was changed, instead of fetching the whole store again to see the result
+    updated = {name: future.result() for name, future in futures.items() if future.result()}
+    save_processed_parameters(full_path, lines, entry_names, updated)
+
+"""
+    Applies the changes read from the parameters file to one parameter in the AWS SSM Parameter Store.
+
+    Each change is a value and a type. If the type is 'DELETE', it deletes the parameter. If the type is 'EDIT', it 
+    updates the parameter value, keeping its original type, unless the value is unchanged. Otherwise it adds the 
+    parameter with the given type. 
+    Whether the parameter exists is taken from the result of get_existing_parameters, which is updated as the 
+    parameter is deleted or added, so a deletion followed by a re-add in the same file both take effect.
+
+    If an error occurs while applying a change, it logs an error message.
+
+    :param name: A string containing the name of the parameter.
+    :param changes: A list of (value, type) tuples in the order they appear in the file.
+    :param existing: A dictionary mapping the name of each existing parameter to its (type, value) tuple.
+    :return: A (value, type) tuple containing the parameter's state after the last successful change, with the 
+             type 'DELETE' if it was deleted, or None if nothing was changed.
+
+"""
+
+def apply_parameter_changes(name, changes, existing):
+    state = None
+    for value, type_name in changes:
+
+        if type_name == 'DELETE':
+            if name in existing:
+                try:
+                    _ssm().delete_parameter(Name=name)
+                    existing.pop(name, None)
+                    _EXISTS_CACHE[name] = False
+                    state = ('', 'DELETE')
+                    print(f"Deleted parameter: {name}")
+                except Exception as e:
+                    print(f"Error deleting parameter {name}: {str(e)}")
+            else:
+                print(f"Parameter {name} does not exist. No deletion needed.")
+        
+        elif type_name == 'EDIT':
+
+            if name in existing:
+                original_type, current_value = existing[name]
+                # Skip the write when the parameter already has this value
+                if current_value == value.strip():
+                    state = (current_value, original_type)
+                    print(f"Parameter {name} already has this value. No update needed.")
+                    continue
+                try:
+                    _ssm().put_parameter (
+                        Name=name,
+                        Value=value.strip(),
+                        Type=original_type,
+                        Overwrite=True
+                    )
+                    existing[name] = (original_type, value.strip())
+                    state = (value.strip(), original_type)
+                    print(f"Updated value for parameter: {name}, keeping original type: {original_type}")
+                except Exception as e:
+                    print(f"Error updating parameter {name}: {str(e)}")
+        else:
+
+            if name not in existing:
+                try:
+                    _ssm().put_parameter (
+                        Name=name,
+                        Value=value,
+                        Type=type_name,
+                        Overwrite=False
+                    )
+                    existing[name] = (type_name, value)
+                    _EXISTS_CACHE[name] = True
+                    state = (value, type_name)
+                    print(f"Added new parameter: {name} with type: {type_name}")
+                except Exception as e:
+                    print(f"Failed to add {name}: {str(e)}")
+            else:
+                print(f"Parameter {name} already exists. No action performed.")
+
+    return state
+
+"""
+    Rewrites the parameters file with the outcome of processing it.
+
+    Each parameter that was changed is written once, at its first line, as "Name = Value (Type: Type)" with its 
+    new value and actual type, and a deleted parameter is written as a comment. Any other lines for a changed 
+    parameter are dropped. All remaining lines, including those for parameters that were left alone or could not 
+    be changed, are kept as they were. This leaves the file in the format that a fetch writes, so it can be 
+    edited and processed again.
+
+    The new contents are written to a temporary file in the same folder, which then replaces the original, so a 
+    failure part way through leaves the original file intact.
+
+    :param full_path: A string containing the path to the parameters file.
+    :param lines: A list of strings containing the lines of the file as it was read.
+    :param entry_names: A dictionary mapping the index of each parameter line to its parameter name.
+    :param updated: A dictionary mapping the name of each changed parameter to its (value, type) state.
+
+"""
+
+def save_processed_parameters(full_path, lines, entry_names, updated):
+    output = []
+    written = set()
+    for index, line in enumerate(lines):
+        name = entry_names.get(index)
+        if name not in updated:
+            output.append(line + '\n')
+        elif name not in written:
+            written.add(name)
+            value, type_name = updated[name]
+            output.append(f"# {name} (Deleted)\n" if type_name == 'DELETE' else f"{name} = {value} (Type: {type_name})\n")
+
+    fd, temp_path = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(full_path)), prefix='.params-', suffix='.tmp')
+    try:
+        with open(fd, 'w', buffering=1 << 18, encoding='utf-8') as file:
+            file.writelines(output)
+        os.replace(temp_path, full_path)
+    except BaseException:
+        os.unlink(temp_path)
+        raise
+
+"""
+    Looks up which of the given parameters exist in the AWS SSM Parameter Store.
+
+    This method uses the AWS SDK (boto3) to get the parameters in batches of 10 names, the most a single 
+    get_parameters call accepts, instead of one get_parameter call per name. Names that do not exist are 
+    returned by SSM as invalid parameters and are left out of the result. The values are decrypted, so edits that 
+    do not change a value can be skipped.
+
+    Errors other than missing names, such as throttling that outlasts the client's retries, are raised rather than 
+    treated as missing parameters, which would add or skip them wrongly.
+
+    :param names: A list of strings containing the names of the parameters to look up.
+    :return: A dictionary mapping the name of each existing parameter to its (type, value) tuple.
+
+"""
+
+def get_existing_parameters(names):
+    existing = {}
+    names = list(dict.fromkeys(names))
+    for start in range(0, len(names), 10):
+        batch = names[start:start + 10]
+        response = hedged_call(_ssm().get_parameters, Names=batch, WithDecryption=True)
+        existing.update((param['Name'], (param['Type'], param['Value'])) for param in response['Parameters'])
+        _EXISTS_CACHE.update((name, name in existing) for name in batch)
+    return existing
 
 """
     Checks if a parameter exists in the AWS SSM Parameter Store.
 
     This method uses the AWS SDK (boto3) to attempt to get a parameter from the SSM Parameter Store with the 
     specified name. If the parameter exists, it returns True. If the parameter does not exist, it catches the 
-    ParameterNotFound exception and returns False.
+    ParameterNotFound exception and returns False. The answer is cached for the rest of the run, and names already 
+    looked up by get_existing_parameters are answered from the cache without a call.
 
-    If an error occurs while checking the parameter, it logs an error message and returns False.
+    Any other error, such as throttling that outlasts the client's retries, is raised rather than reported as the 
+    parameter not existing.
 
     :param name: A string containing the name of the parameter to check.
     :return: A boolean indicating whether the parameter exists.
@@ -142,13 +411,16 @@ def process_parameters_from_file(folder_path, file_name):
 
 def parameter_exists(name):
 
+    cached = _EXISTS_CACHE.get(name)
+    if cached is not None:
+        return cached
+
     try:
-        ssm.get_parameter(Name=name)
+        hedged_call(_ssm().get_parameter, Name=name)
+        _EXISTS_CACHE[name] = True
         return True
-    except ssm.exceptions.ParameterNotFound:
-        return False
-    except Exception as e:
-        print(f"Error checking parameter existence for {name}: {str(e)}")
+    except _ssm().exceptions.ParameterNotFound:
+        _EXISTS_CACHE[name] = False
         return False
     
 """
@@ -162,15 +434,17 @@ def parameter_exists(name):
     If the operation is not 'fetch' or 'process', it prints an error message.
 
     :param operation: A string containing the operation to perform. Valid values are 'fetch' and 'process'.
-    :param prefix: A string containing the prefix to filter parameters by. Only used if operation is 'fetch'.
+    :param prefix: A string containing the path to fetch parameters from. Only used if operation is 'fetch'.
     :param folder_path: A string containing the path to the directory where the file is located or should be saved.
     :param file_name: A string containing the name of the file to read the parameters from or save the parameters in.
+    :param sub_prefixes: An optional list of strings containing paths to fetch concurrently instead of the prefix. 
+                         Only used if operation is 'fetch'.
 
 """
 
-def manage_parameters(operation, prefix=None, folder_path=None, file_name=None):
+def manage_parameters(operation, prefix=None, folder_path=None, file_name=None, sub_prefixes=None):
     if operation == 'fetch':
-        fetch_and_save_parameters(prefix, folder_path, file_name)
+        fetch_and_save_parameters(prefix, folder_path, file_name, sub_prefixes)
     elif operation == 'process':
         process_parameters_from_file(folder_path, file_name)
     else:
@@ -180,8 +454,9 @@ def manage_parameters(operation, prefix=None, folder_path=None, file_name=None):
 """
     Generates a random password of a specified length.
 
-    This method creates a string of all possible characters (letters, digits, and punctuation), and then selects 
-    a random character from this string for each character in the password. It returns the resulting password.
+    This method draws all the characters of the password at once from the possible characters (letters, digits, 
+    and punctuation), using the operating system's cryptographically secure random source. It returns the 
+    resulting password.
 
     :param length: An integer specifying the length of the password to generate. Defaults to 12.
     :return: A string containing the generated password.
@@ -189,8 +464,7 @@ def manage_parameters(operation, prefix=None, folder_path=None, file_name=None):
 """
 
 def generate_password(length=12):
-    characters = string.ascii_letters + string.digits + string.punctuation
-    password = ''.join(random.choice(characters) for i in range(length))
+    password = ''.join(_SYSTEM_RANDOM.choices(_PASSWORD_CHARACTERS, k=length))
     return password
 
 
@@ -198,14 +472,14 @@ def generate_password(length=12):
 #for j in range(10):
 #    print(generate_password(20))
 
-'''
+if __name__ == '__main__':
+
     # Uncomment the manage_parameters function call below and run it initially to fetch parameters from AWS SSM and save them to a local file.
-    # Customize 'prefix', 'folder_path', and 'file_name' as needed.
-'''
-# manage_parameters('fetch', prefix='/', folder_path='e:\ETLsolutions\parameterStore', file_name='parameters.txt')
+    # Customize 'prefix' as needed; set ETL_PARAM_DIR and ETL_PARAM_FILE to change the folder and file name.
+    # manage_parameters('fetch', prefix='/', folder_path=PARAM_DIR, file_name=PARAM_FILE)
 
-# Process parameters from a local file and update AWS SSM Parameter Store. Customize 'folder_path' and 'file_name' as needed.
-manage_parameters('process', folder_path='e:\ETLsolutions\parameterStore', file_name='parameters.txt')
+    # Process parameters from a local file and update AWS SSM Parameter Store, rewriting the file with the result.
+    manage_parameters('process', folder_path=PARAM_DIR, file_name=PARAM_FILE)
 
-# Fetch updated parameters from AWS SSM and save them again to a local file for verification. Customize 'prefix', 'folder_path', and 'file_name' as needed.
-manage_parameters('fetch', prefix='/', folder_path='e:\ETLsolutions\parameterStore', file_name='parameters.txt')
\ No newline at end of file
+    # Uncomment to fetch the parameters from AWS SSM again, such as to pick up changes made outside this file.
+    # manage_parameters('fetch', prefix='/', folder_path=PARAM_DIR, file_name=PARAM_FILE)
@@ -6,35 +6,64 @@
     # 1. 'sftp_password'
     # 2. 'smtp_password'
     # 3. 'sql_password'
-    # Each parameter is created or updated with the specified name and marked as a SecureString, with overwrite enabled.
+    # Each parameter is created as a SecureString if it does not exist. An existing parameter is only overwritten when its value
+    # differs, and keeps the KMS key it was encrypted with.
 
 '''
 
 import boto3
+import functools
+import os
+from botocore.config import Config
 
-# Replace region_name with the AWS Region in which you want to create the parameters.
-ssm = boto3.client('ssm', region_name='us-west-2') 
-
-# SFTP Password
-ssm.put_parameter(
-    Name='sftp_password',  
-    Value='', # Replace the empty string in 'Value' with your actual password for the parameter being set.
-    Type='SecureString',
-    Overwrite=True
-)
-
-# Mail Server Password
-ssm.put_parameter(
-    Name='smtp_password',  
-    Value='', # Replace the empty string in 'Value' with your actual password for the parameter being set. 
-    Type='SecureString',
-    Overwrite=True
-)
-
-# SQL Server Password
-ssm.put_parameter(
-    Name='sql_password',  
-    Value='', # Replace the empty string in 'Value' with your actual password for the parameter being set.  
-    Type='SecureString',
-    Overwrite=True
-)
\ No newline at end of file
+# The AWS Region in which you want to create the parameters. Set AWS_REGION in the environment to override it.
+REGION = os.environ.get('AWS_REGION', 'us-west-2')
+
+# Create the SSM client on first use, keeping connections alive between calls and retrying throttled calls with adaptive backoff
+@functools.lru_cache(maxsize=1)
+def _ssm():
+    return boto3.client('ssm', region_name=REGION, config=Config(
+        max_pool_connections=10,
+        tcp_keepalive=True,
+        connect_timeout=3,
+        read_timeout=10,
+        retries={'max_attempts': 10, 'mode': 'adaptive'}
+    ))
+
+# The parameters to set, as (name, value) pairs. Replace the empty strings with your actual passwords for the parameters being set.
+parameters = [
+    ('sftp_password', ''),  # SFTP Password
+    ('smtp_password', ''),  # Mail Server Password
+    ('sql_password', ''),   # SQL Server Password
+]
+
+# Set a parameter as a SecureString, skipping it when the value is unchanged, and keeping the KMS key of an existing parameter
+def set_secure_parameter(name, value):
+    try:
+        current = _ssm().get_parameter(Name=name, WithDecryption=True)['Parameter']
+    except _ssm().exceptions.ParameterNotFound:
+        # Create the missing parameter with the default key
+        _ssm().put_parameter(Name=name, Value=value, Type='SecureString', Overwrite=False)
+        print(f"Added new parameter: {name}")
+        return
+
+    if current['Value'] == value:
+        print(f"Parameter {name} already has this value. No update needed.")
+        return
+
+    # Look up the parameter's key, since overwriting without one would reset it to the default alias/aws/ssm key
+    described = _ssm().describe_parameters(ParameterFilters=[{'Key': 'Name', 'Values': [name]}])['Parameters']
+    key_id = described[0].get('KeyId') if described else None
+    _ssm().put_parameter(
+        Name=name,
+        Value=value,
+        Type='SecureString',
+        Overwrite=True,
+        **({'KeyId': key_id} if key_id else {})
+    )
+    print(f"Updated value for parameter: {name}")
+
+# Set each parameter, reusing the client's keep-alive connection for all of them
+if __name__ == '__main__':
+    for name, value in parameters:
+        set_secure_parameter(name, value)